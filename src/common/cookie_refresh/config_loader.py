@@ -7,7 +7,9 @@ in the expected format for existing code.
 """
 
 import os
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -23,6 +25,13 @@ if notif_env_path.exists():
     load_dotenv(notif_env_path)
 
 
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime); edits change the key."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load configuration from JSON file with environment variable overrides.
     
@@ -52,14 +61,16 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     # Load from JSON if exists
     if config_path and config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                loaded_config = json.load(f)
-                # Merge with defaults
-                for key, value in loaded_config.items():
-                    if isinstance(value, dict) and key in config:
-                        config[key].update(value)
-                    else:
-                        config[key] = value
+            # Cached parse; copied so callers can't mutate the cached dict
+            loaded_config = copy.deepcopy(
+                _read_config_file(str(config_path), config_path.stat().st_mtime_ns)
+            )
+            # Merge with defaults
+            for key, value in loaded_config.items():
+                if isinstance(value, dict) and key in config:
+                    config[key].update(value)
+                else:
+                    config[key] = value
         except Exception as e:
             print(f"Warning: Could not load config from {config_path}: {e}")
     
@@ -116,6 +116,20 @@ class NotificationChannel(ABC):
             True if channel is configured and available
         """
         pass
+    
+    def send_batch(self, events: List[NotificationEvent]) -> int:
+        """Send several notifications through this channel.
+        
+        Channels that hold a connection override this to reuse one
+        connection for the whole batch.
+        
+        Args:
+            events: Notification events to send
+            
+        Returns:
+            Number of events sent successfully
+        """
+        return sum(1 for event in events if self.send(event))
 
 
 class ConsoleNotificationChannel(NotificationChannel):
@@ -220,27 +234,10 @@ class EmailNotificationChannel(NotificationChannel):
         # Attempt to send with retries
         for attempt in range(self.max_retries):
             try:
-                # Create message
-                msg = MIMEMultipart('alternative')
-                msg['From'] = self.from_email
-                msg['To'] = ', '.join(self.to_emails)
-                msg['Subject'] = self._get_subject(event)
-                msg['X-Priority'] = '1' if event.level == NotificationLevel.CRITICAL else '3'
-                
-                # Create both plain text and HTML versions
-                text_body = self._create_text_body(event)
-                html_body = self._create_html_body(event)
-                
-                # Attach parts
-                msg.attach(MIMEText(text_body, 'plain'))
-                msg.attach(MIMEText(html_body, 'html'))
+                msg = self._create_message(event)
                 
                 # Send email
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                    if self.use_tls:
-                        server.starttls()
-                    if self.smtp_user and self.smtp_password:
-                        server.login(self.smtp_user, self.smtp_password)
+                with self._connect() as server:
                     server.send_message(msg)
                 
                 logger.info(f"Email notification sent for {event.service} (attempt {attempt + 1})")
@@ -256,6 +253,60 @@ class EmailNotificationChannel(NotificationChannel):
         
         return False
     
+    def send_batch(self, events: List[NotificationEvent]) -> int:
+        """Send several emails over a single SMTP session."""
+        if not self.is_available():
+            logger.warning("Email notification channel not properly configured")
+            return 0
+        
+        pending = [self._create_message(event) for event in events]
+        sent = 0
+        for attempt in range(self.max_retries):
+            try:
+                with self._connect() as server:
+                    while pending:
+                        server.send_message(pending[0])
+                        pending.pop(0)
+                        sent += 1
+                
+                logger.info(f"Email batch of {sent} notifications sent (attempt {attempt + 1})")
+                return sent
+                
+            except Exception as e:
+                logger.warning(f"Email batch attempt {attempt + 1} failed: {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay)
+                else:
+                    logger.error(f"Failed to send {len(pending)} emails after {self.max_retries} attempts: {e}")
+        
+        return sent
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP session, upgraded to TLS and logged in as configured."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.smtp_user and self.smtp_password:
+                server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _create_message(self, event: NotificationEvent) -> MIMEMultipart:
+        """Build the multipart (plain text + HTML) email for an event."""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.from_email
+        msg['To'] = ', '.join(self.to_emails)
+        msg['Subject'] = self._get_subject(event)
+        msg['X-Priority'] = '1' if event.level == NotificationLevel.CRITICAL else '3'
+        
+        # Create both plain text and HTML versions
+        msg.attach(MIMEText(self._create_text_body(event), 'plain'))
+        msg.attach(MIMEText(self._create_html_body(event), 'html'))
+        return msg
+    
     def _get_subject(self, event: NotificationEvent) -> str:
         """Generate email subject based on event level and service."""
         emoji_map = {
@@ -462,6 +513,19 @@ class WebhookNotificationChannel(NotificationChannel):
             logger.warning("Webhook notification channel not configured")
             return False
         
+        return self._post(event, requests)
+    
+    def send_batch(self, events: List[NotificationEvent]) -> int:
+        """Send several notifications over one keep-alive HTTP session."""
+        if not self.is_available():
+            logger.warning("Webhook notification channel not configured")
+            return 0
+        
+        with requests.Session() as session:
+            return sum(1 for event in events if self._post(event, session))
+    
+    def _post(self, event: NotificationEvent, http) -> bool:
+        """POST one event with retries via ``http`` (requests or a Session)."""
         # Format payload based on webhook type
         if self.webhook_type == 'discord':
             payload = self._format_discord_payload(event)
@@ -473,7 +537,7 @@ class WebhookNotificationChannel(NotificationChannel):
         # Send with retries
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = http.post(
                     self.webhook_url,
                     json=payload,
                     timeout=self.timeout
@@ -768,12 +832,7 @@ class CookieRefreshNotifier:
         Args:
             event: Notification event to send
         """
-        # Add to history
-        self._notification_history.append(event)
-        
-        # Limit history size
-        if len(self._notification_history) > 1000:
-            self._notification_history = self._notification_history[-500:]
+        self._record(event)
         
         # Send to all channels
         success_count = 0
@@ -791,6 +850,55 @@ class CookieRefreshNotifier:
         else:
             logger.info(f"Notification sent through {success_count}/{len(self.channels)} channels")
     
+    def _record(self, event: NotificationEvent):
+        """Add an event to the bounded notification history."""
+        self._notification_history.append(event)
+        
+        # Limit history size
+        if len(self._notification_history) > 1000:
+            self._notification_history = self._notification_history[-500:]
+    
+    def send_batch(self, notifications: List[Dict[str, Any]]):
+        """Send several custom notifications in one pass per channel.
+        
+        Each channel receives the whole batch at once, so connection-based
+        channels (email, webhook) connect once instead of once per event.
+        
+        Args:
+            notifications: ``send_custom_notification`` keyword dicts
+                (``level``, ``message`` and optional ``service``/``details``)
+        """
+        if not notifications:
+            return
+        
+        events = [
+            NotificationEvent(
+                service=n.get('service', 'SYSTEM'),
+                level=n['level'],
+                message=n['message'],
+                details=n.get('details')
+            )
+            for n in notifications
+        ]
+        for event in events:
+            self._record(event)
+        
+        # Send to all channels
+        success_count = 0
+        for channel in self.channels:
+            try:
+                if channel.is_available():
+                    success_count += channel.send_batch(events)
+            except Exception as e:
+                logger.error(f"Error sending notification batch through {channel.__class__.__name__}: {e}")
+        
+        # Log summary
+        attempted = len(events) * len(self.channels)
+        if success_count == 0:
+            logger.error(f"Failed to send {len(events)} notifications through any channel")
+        else:
+            logger.info(f"Notification batch sent: {success_count}/{attempted} deliveries")
+    
     def get_notification_history(self, service: Optional[str] = None, 
                                limit: int = 100) -> List[NotificationEvent]:
         """Get notification history.
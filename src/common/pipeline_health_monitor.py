@@ -12,17 +12,28 @@ Transforms pipeline monitoring from passive reporting to active management:
 """
 
 import os
+import io
 import sys
+import fnmatch
 import json
+import codecs
+import string
 import subprocess
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union, Final
 from collections import defaultdict
+import queue
+import threading
 from enum import Enum
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 # Set up structured logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,25 +41,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Import our cookie refresh system
+# Cookie refresh system is imported lazily in PipelineHealthMonitor.__init__
+# so read-only monitors (dashboards, --json-only) skip the notifier/config setup.
 sys.path.append(str(Path(__file__).parent.parent))
-try:
-    from cookie_refresh.refresher import CookieRefresher
-    from cookie_refresh.notifier import CookieRefreshNotifier, NotificationLevel
-    from cookie_refresh.config_loader import load_config
-    COOKIE_REFRESH_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Cookie refresh system not available: {e}")
-    COOKIE_REFRESH_AVAILABLE = False
-    # Define dummy classes to prevent errors
-    class CookieRefresher:
-        pass
-    class CookieRefreshNotifier:
-        pass
-    class NotificationLevel:
-        pass
-    def load_config():
-        return {}
+COOKIE_REFRESH_AVAILABLE = None  # Resolved on first auto-remediation monitor
 
 PROJECT_ROOT = os.environ.get('PROJECT_ROOT')
 if not PROJECT_ROOT:
@@ -57,6 +53,14 @@ if not PROJECT_ROOT:
 
 PROJECT_ROOT = Path(PROJECT_ROOT)
 
+# Data file types considered when measuring zone freshness
+SUBDIR_FILE_EXTENSIONS = ('.json', '.csv', '.ndjson', '.parquet', '.tsv')
+ZONE_FILE_EXTENSIONS = SUBDIR_FILE_EXTENSIONS + ('.html',)
+
+# Service checks run concurrently in daemon threads; one hung check must not
+# stall the report or keep the process alive
+SERVICE_CHECK_TIMEOUT_S = 30.0
+
 
 class HealthStatus(Enum):
     """Health status levels for services and pipeline components."""
@@ -66,6 +70,21 @@ class HealthStatus(Enum):
     FAILED = "FAILED"          # Service is down or completely broken
     
 
+_HEALTHY_VAL = HealthStatus.HEALTHY.value
+
+# Statuses that mark a service as needing immediate attention
+CRITICAL_STATES = frozenset({HealthStatus.CRITICAL.value, HealthStatus.FAILED.value})
+
+# HTML report lookups: status value -> CSS class / overall-status background
+_STATUS_CLASS = {status.value: status.value.lower() for status in HealthStatus}
+_STATUS_BG = {
+    HealthStatus.HEALTHY.value: '#d4edda',
+    HealthStatus.WARNING.value: '#fff3cd',
+    HealthStatus.CRITICAL.value: '#f8d7da',
+    HealthStatus.FAILED.value: '#f8d7da',
+}
+
+
 class ServicePriority(Enum):
     """Service priority levels for determining remediation urgency."""
     CRITICAL = 1    # TooLost - requires weekly refresh
@@ -74,16 +93,155 @@ class ServicePriority(Enum):
     LOW = 4         # MetaAds - nice to have
 
 
+# Static HTML report shell; only the placeholders in _HTML_HEAD vary per report
+_HTML_HEAD: Final[str] = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>BEDROT Pipeline Health Report</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        h1, h2 {{ color: #333; }}
+        .status-badge {{ display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: bold; color: white; }}
+        .status-healthy {{ background: #28a745; }}
+        .status-warning {{ background: #ffc107; color: #333; }}
+        .status-critical {{ background: #dc3545; }}
+        .status-failed {{ background: #6c757d; }}
+        .service-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 20px 0; }}
+        .service-card {{ border: 1px solid #ddd; border-radius: 8px; padding: 15px; }}
+        .service-card.critical {{ border-color: #dc3545; background: #f8d7da; }}
+        .service-card.warning {{ border-color: #ffc107; background: #fff3cd; }}
+        .service-card.healthy {{ border-color: #28a745; background: #d4edda; }}
+        .metric {{ margin: 10px 0; }}
+        .metric-label {{ font-weight: bold; color: #666; }}
+        .action-item {{ margin: 5px 0; padding: 8px; background: #e9ecef; border-radius: 4px; }}
+        .urgent {{ background: #f8d7da; border-left: 4px solid #dc3545; }}
+        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+        th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background: #f8f9fa; font-weight: bold; }}
+        .timestamp {{ color: #666; font-size: 0.9em; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>BEDROT Pipeline Health Report</h1>
+        <p class="timestamp">Generated: {timestamp}</p>
+        
+        <div style="margin: 20px 0; padding: 15px; background: {overall_bg}; border-radius: 8px;">
+            <h2 style="margin: 0;">Overall Status: <span class="status-badge status-{overall_class}">{overall_status}</span></h2>
+            <p style="margin: 10px 0 0 0;">Auto-Remediation: <strong>{auto_remediation}</strong></p>
+        </div>
+        
+        <h2>Service Health Overview</h2>
+        <div class="service-grid">
+"""
+
+_HTML_TAIL: Final[str] = """
+    </div>
+</body>
+</html>
+"""
+
+
+_CARD_TMPL = string.Template("""
+            <div class="service-card $cls">
+                <h3>$name <span class="status-badge status-$cls">$score%</span></h3>
+                <div class="metric">
+                    <span class="metric-label">Priority:</span> $priority
+                </div>
+                <div class="metric">
+                    <span class="metric-label">Cookie Status:</span> $cookie_status
+                    $cookie_expiry
+                </div>
+                <div class="metric">
+                    <span class="metric-label">Data Age:</span> 
+                    $data_age
+                </div>
+                $bottlenecks
+            </div>
+""")
+
+
+def _render_card(service: str, data: Dict) -> str:
+    """Render one service card for the HTML report."""
+    cookie_health = data['cookie_health']
+    days_old = data['freshness']['landing']['days_old']
+    return _CARD_TMPL.substitute(
+        cls=_STATUS_CLASS[data['status']],
+        name=service.upper(),
+        score=data['health_score'],
+        priority=data['priority'],
+        cookie_status=cookie_health['status'],
+        cookie_expiry=(f" (expires in {cookie_health.get('expires_in', 'N/A')} days)"
+                       if cookie_health['status'] == 'valid' else ''),
+        data_age=f"{days_old} days" if days_old is not None else 'No data',
+        bottlenecks=(f'<div class="metric"><span class="metric-label">Bottlenecks:</span> {len(data["bottlenecks"])}</div>'
+                     if data['bottlenecks'] else ''),
+    )
+
+
+def _action_buckets(report: Dict) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Return (urgent, normal) (service, recommendation) pairs for a report.
+    
+    Computed once and cached under the private ``_urgent_actions`` /
+    ``_normal_actions`` keys, which are never serialized.
+    """
+    if '_urgent_actions' not in report:
+        urgent_actions = []
+        normal_actions = []
+        for service, data in report['services'].items():
+            is_critical = data['status'] in CRITICAL_STATES
+            for rec in data['recommendations']:
+                if is_critical or 'URGENT' in rec:
+                    urgent_actions.append((service, rec))
+                else:
+                    normal_actions.append((service, rec))
+        report['_urgent_actions'] = urgent_actions
+        report['_normal_actions'] = normal_actions
+    return report['_urgent_actions'], report['_normal_actions']
+
+
+def _public_report(report: Dict) -> Dict:
+    """Shallow copy of a report without its private (``_``-prefixed) keys."""
+    return {key: value for key, value in report.items() if not key.startswith('_')}
+
+
+def dump_report_json(report: Dict) -> bytes:
+    """Serialize a health report to indented JSON bytes (orjson when available)."""
+    report = _public_report(report)
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2).encode('utf-8')
+
+
+def write_report_json(report: Dict, fp) -> None:
+    """Write a health report as indented JSON to a binary file object.
+    
+    Without orjson, the stdlib encoder streams chunks straight into ``fp``
+    instead of materializing the whole document first.
+    """
+    report = _public_report(report)
+    if orjson is not None:
+        fp.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        json.dump(report, codecs.getwriter('utf-8')(fp), indent=2, separators=(',', ': '))
+
+
 class PipelineHealthMonitor:
     """Active pipeline health management system."""
     
-    def __init__(self, enable_auto_remediation: bool = True, enable_notifications: bool = True):
+    def __init__(self, enable_auto_remediation: bool = True, enable_notifications: bool = True,
+                 cache_ttl_s: float = 5.0, enable_html: bool = True):
         self.project_root = PROJECT_ROOT
         self.zones = ['landing', 'raw', 'staging', 'curated']
         self.services = ['spotify', 'tiktok', 'distrokid', 'toolost', 'linktree', 'metaads']
         self.health_report = {}
         self.enable_auto_remediation = enable_auto_remediation
         self.enable_notifications = enable_notifications
+        self.enable_html = enable_html
         
         # Service priority mapping for weighted scoring
         self.service_priority = {
@@ -96,25 +254,43 @@ class PipelineHealthMonitor:
         }
         
         # Initialize cookie refresh manager if auto-remediation is enabled
-        if self.enable_auto_remediation and COOKIE_REFRESH_AVAILABLE:
+        self.cookie_manager = None
+        self.notifier = None
+        if self.enable_auto_remediation:
+            global COOKIE_REFRESH_AVAILABLE
             try:
-                config = load_config()
-                self.cookie_manager = CookieRefresher(config)
-                self.notifier = CookieRefreshNotifier(config.get('notifications', {})) if self.enable_notifications else None
-                logger.info("Cookie refresh manager initialized for auto-remediation")
-            except Exception as e:
-                logger.warning(f"Could not initialize cookie refresh manager: {e}")
-                self.cookie_manager = None
-                self.notifier = None
-        else:
-            if self.enable_auto_remediation and not COOKIE_REFRESH_AVAILABLE:
+                from cookie_refresh.refresher import CookieRefresher
+                from cookie_refresh.notifier import CookieRefreshNotifier
+                from cookie_refresh.config_loader import load_config
+                COOKIE_REFRESH_AVAILABLE = True
+            except ImportError as e:
+                logger.warning(f"Cookie refresh system not available: {e}")
+                COOKIE_REFRESH_AVAILABLE = False
+            
+            if COOKIE_REFRESH_AVAILABLE:
+                try:
+                    config = load_config()
+                    self.cookie_manager = CookieRefresher(config)
+                    self.notifier = CookieRefreshNotifier(config.get('notifications', {})) if self.enable_notifications else None
+                    logger.info("Cookie refresh manager initialized for auto-remediation")
+                except Exception as e:
+                    logger.warning(f"Could not initialize cookie refresh manager: {e}")
+                    self.cookie_manager = None
+                    self.notifier = None
+            else:
                 logger.warning("Auto-remediation requested but cookie refresh system not available")
-            self.cookie_manager = None
-            self.notifier = None
             
         # Track remediation actions taken
         self.remediation_log = []
         
+        # Short-lived report cache for high-frequency dashboard polling
+        self.cache_ttl_s = cache_ttl_s
+        self._last_report: Optional[Dict] = None
+        self._last_report_ts: float = 0.0
+        
+        # Latest check thread per service, so a hung one is not started again
+        self._check_threads: Dict[str, threading.Thread] = {}
+        
     def check_zone_freshness(self, service: str) -> Dict[str, Dict]:
         """Check data freshness in each zone for a service."""
         freshness = {}
@@ -130,18 +306,16 @@ class PipelineHealthMonitor:
                 }
                 continue
                 
-            # Find most recent file
-            all_files = []
-            for ext in ['*.json', '*.csv', '*.ndjson', '*.parquet', '*.tsv', '*.html']:
-                all_files.extend(zone_path.glob(ext))
-            
-            # Also check subdirectories (like toolost/streams)
-            for subdir in zone_path.iterdir():
-                if subdir.is_dir():
-                    for ext in ['*.json', '*.csv', '*.ndjson', '*.parquet', '*.tsv']:
-                        all_files.extend(subdir.glob(ext))
+            # Find most recent file (the whole zone is scanned: latest_file and
+            # full_path are reported, so an early exit would name the wrong file)
+            latest_entry = None
+            latest_mtime = 0.0
+            for entry in self._iter_zone_files(zone_path):
+                mtime = entry.stat().st_mtime
+                if latest_entry is None or mtime > latest_mtime:
+                    latest_entry, latest_mtime = entry, mtime
             
-            if not all_files:
+            if latest_entry is None:
                 freshness[zone] = {
                     'exists': True,
                     'latest_file': None,
@@ -150,8 +324,8 @@ class PipelineHealthMonitor:
                 }
                 continue
             
-            latest_file = max(all_files, key=lambda p: p.stat().st_mtime)
-            latest_date = datetime.fromtimestamp(latest_file.stat().st_mtime)
+            latest_file = Path(latest_entry.path)
+            latest_date = datetime.fromtimestamp(latest_mtime)
             days_old = (datetime.now() - latest_date).days
             
             freshness[zone] = {
@@ -164,6 +338,26 @@ class PipelineHealthMonitor:
             
         return freshness
     
+    @staticmethod
+    def _iter_zone_files(zone_path: Path):
+        """Yield scandir entries for data files in a zone and its subdirectories.
+        
+        Subdirectories (like toolost/streams) are checked for everything but HTML.
+        """
+        with os.scandir(zone_path) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(ZONE_FILE_EXTENSIONS):
+                    yield entry
+        
+        for subdir in subdirs:
+            with os.scandir(subdir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(SUBDIR_FILE_EXTENSIONS):
+                        yield entry
+    
     def check_cookie_health(self, service: str) -> Dict:
         """Check cookie status for a service."""
         cookie_patterns = {
@@ -183,12 +377,15 @@ class PipelineHealthMonitor:
         if '*' in pattern:
             cookie_dir = self.project_root / Path(pattern).parent
             if cookie_dir.exists():
-                cookie_files = list(cookie_dir.glob(Path(pattern).name))
+                # DirEntry.stat() reuses the dirent data, avoiding a Path per candidate
+                name_pattern = Path(pattern).name
+                with os.scandir(cookie_dir) as entries:
+                    cookie_files = [e for e in entries if fnmatch.fnmatchcase(e.name, name_pattern)]
                 if cookie_files:
                     # Check all cookie files
                     results = []
                     for cookie_file in cookie_files:
-                        account = cookie_file.stem.replace(f'{service}_cookies_', '')
+                        account = os.path.splitext(cookie_file.name)[0].replace(f'{service}_cookies_', '')
                         result = self._check_single_cookie(cookie_file, service)
                         result['account'] = account
                         results.append(result)
@@ -200,9 +397,9 @@ class PipelineHealthMonitor:
                 return self._check_single_cookie(cookie_path, service)
             return {'status': 'missing', 'message': 'Cookie file not found'}
     
-    def _check_single_cookie(self, cookie_path: Path, service: str) -> Dict:
-        """Check a single cookie file."""
-        file_age = datetime.now() - datetime.fromtimestamp(cookie_path.stat().st_mtime)
+    def _check_single_cookie(self, cookie_path: Union[Path, os.DirEntry], service: str) -> Dict:
+        """Check a single cookie file (a Path or a scandir DirEntry)."""
+        days_old = int((time.time() - cookie_path.stat().st_mtime) // 86400)
         
         # Service-specific expiry times
         expiry_days = {
@@ -215,13 +412,13 @@ class PipelineHealthMonitor:
         }
         
         max_age = expiry_days.get(service, 30)
-        is_expired = file_age.days > max_age
+        is_expired = days_old > max_age
         
         return {
             'status': 'expired' if is_expired else 'valid',
-            'days_old': file_age.days,
+            'days_old': days_old,
             'max_age': max_age,
-            'expires_in': max_age - file_age.days if not is_expired else 0,
+            'expires_in': max_age - days_old if not is_expired else 0,
             'file': cookie_path.name
         }
     
@@ -334,8 +531,17 @@ class PipelineHealthMonitor:
         
         return recommendations, auto_actions
     
-    def generate_report(self) -> Dict:
-        """Generate comprehensive health report with auto-remediation."""
+    def generate_report(self, force: bool = False) -> Dict:
+        """Generate comprehensive health report with auto-remediation.
+        
+        Reports are served from memory for ``cache_ttl_s`` seconds unless
+        ``force`` is set, since zone/cookie mtimes change far slower than
+        dashboards poll.
+        """
+        if (not force and self._last_report is not None
+                and time.monotonic() - self._last_report_ts < self.cache_ttl_s):
+            return self._last_report
+        
         report = {
             'timestamp': datetime.now().isoformat(),
             'services': {},
@@ -347,47 +553,20 @@ class PipelineHealthMonitor:
         all_auto_actions = []
         overall_scores = []
         
+        results = self._check_services()
         for service in self.services:
-            logger.info(f"Checking {service}...")
-            
-            freshness = self.check_zone_freshness(service)
-            cookie_health = self.check_cookie_health(service)
-            bottlenecks = self.detect_pipeline_bottlenecks(service, freshness)
-            recommendations, auto_actions = self.get_recommendations(service, freshness, cookie_health, bottlenecks)
-            
-            # Calculate weighted health score based on service priority
-            health_score = self._calculate_weighted_health_score(
-                service, freshness, cookie_health, bottlenecks
-            )
-            
-            # Determine service status
-            if health_score >= 80:
-                status = HealthStatus.HEALTHY
-            elif health_score >= 60:
-                status = HealthStatus.WARNING
-            elif health_score >= 30:
-                status = HealthStatus.CRITICAL
-            else:
-                status = HealthStatus.FAILED
-            
-            overall_scores.append(health_score)
-            all_auto_actions.extend(auto_actions)
-            
-            report['services'][service] = {
-                'health_score': health_score,
-                'status': status.value,
-                'priority': self.service_priority.get(service, ServicePriority.LOW).name,
-                'freshness': freshness,
-                'cookie_health': cookie_health,
-                'bottlenecks': bottlenecks,
-                'recommendations': recommendations,
-                'auto_actions': auto_actions
-            }
+            service_data = results.get(service) or self._timed_out_service(service)
+            overall_scores.append(service_data['health_score'])
+            all_auto_actions.extend(service_data['auto_actions'])
+            report['services'][service] = service_data
+        
+        # Bucket recommendations once for both the console and HTML reports
+        _action_buckets(report)
         
         # Determine overall pipeline status
         avg_score = sum(overall_scores) / len(overall_scores) if overall_scores else 0
         critical_services = [s for s, d in report['services'].items() 
-                           if d['status'] in [HealthStatus.CRITICAL.value, HealthStatus.FAILED.value]]
+                           if d['status'] in CRITICAL_STATES]
         
         if avg_score >= 80 and not critical_services:
             report['overall_status'] = HealthStatus.HEALTHY.value
@@ -401,11 +580,110 @@ class PipelineHealthMonitor:
         # Execute auto-remediation if enabled
         if self.enable_auto_remediation and all_auto_actions:
             report['remediation_actions'] = self._execute_auto_remediation(all_auto_actions)
+            # Remediation changed pipeline state, so don't serve this report again
+            self._last_report = None
+            self._last_report_ts = 0.0
         else:
             report['remediation_actions'] = all_auto_actions
+            self._last_report = report
+            self._last_report_ts = time.monotonic()
         
         return report
     
+    def _check_services(self) -> Dict[str, Dict]:
+        """Run every service check concurrently, waiting up to SERVICE_CHECK_TIMEOUT_S.
+        
+        Services whose check has not finished in time are absent from the result.
+        A hung check is not cancelled: it is left running in its daemon thread,
+        which cannot block interpreter exit, and that service is not checked
+        again until it returns, so repeated reports leak at most one thread per
+        service.
+        """
+        done: queue.Queue = queue.Queue()
+        pending = set()
+        for service in self.services:
+            previous = self._check_threads.get(service)
+            if previous is not None and previous.is_alive():
+                logger.error(f"Previous {service} health check is still running; not starting another")
+                continue
+            thread = threading.Thread(target=self._check_service_into, args=(service, done),
+                                      name=f"health-check-{service}", daemon=True)
+            self._check_threads[service] = thread
+            pending.add(service)
+            thread.start()
+        
+        results = {}
+        deadline = time.monotonic() + SERVICE_CHECK_TIMEOUT_S
+        while pending:
+            try:
+                service, data, error = done.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                logger.error(f"Health checks timed out after {SERVICE_CHECK_TIMEOUT_S}s: {', '.join(sorted(pending))}")
+                break
+            if error is not None:
+                raise error
+            pending.discard(service)
+            results[service] = data
+        return results
+    
+    def _check_service_into(self, service: str, done: queue.Queue) -> None:
+        """Thread target: put (service, result, error) on *done*."""
+        try:
+            done.put((service, self._check_service(service), None))
+        except Exception as e:
+            done.put((service, None, e))
+    
+    def _check_service(self, service: str) -> Dict:
+        """Check a single service. Only reads shared state, so safe to run in a thread."""
+        logger.info(f"Checking {service}...")
+        
+        freshness = self.check_zone_freshness(service)
+        cookie_health = self.check_cookie_health(service)
+        bottlenecks = self.detect_pipeline_bottlenecks(service, freshness)
+        recommendations, auto_actions = self.get_recommendations(service, freshness, cookie_health, bottlenecks)
+        
+        # Calculate weighted health score based on service priority
+        health_score = self._calculate_weighted_health_score(
+            service, freshness, cookie_health, bottlenecks
+        )
+        
+        # Determine service status
+        if health_score >= 80:
+            status = HealthStatus.HEALTHY
+        elif health_score >= 60:
+            status = HealthStatus.WARNING
+        elif health_score >= 30:
+            status = HealthStatus.CRITICAL
+        else:
+            status = HealthStatus.FAILED
+        
+        return {
+            'health_score': health_score,
+            'status': status.value,
+            'priority': self.service_priority.get(service, ServicePriority.LOW).name,
+            'freshness': freshness,
+            'cookie_health': cookie_health,
+            'bottlenecks': bottlenecks,
+            'recommendations': recommendations,
+            'auto_actions': auto_actions
+        }
+    
+    def _timed_out_service(self, service: str) -> Dict:
+        """Placeholder entry for a service whose check did not finish in time."""
+        return {
+            'health_score': 0,
+            'status': HealthStatus.FAILED.value,
+            'priority': self.service_priority.get(service, ServicePriority.LOW).name,
+            'freshness': {
+                zone: {'exists': False, 'latest_file': None, 'latest_date': None, 'days_old': None}
+                for zone in self.zones
+            },
+            'cookie_health': {'status': 'unknown'},
+            'bottlenecks': [f"Health check timed out after {SERVICE_CHECK_TIMEOUT_S}s"],
+            'recommendations': [f"URGENT: {service} health check did not complete - investigate hung I/O"],
+            'auto_actions': []
+        }
+    
     def _calculate_weighted_health_score(self, service: str, freshness: Dict, 
                                        cookie_health: Dict, bottlenecks: List[str]) -> int:
         """Calculate health score with priority weighting."""
@@ -456,9 +734,23 @@ class PipelineHealthMonitor:
         """Execute automatic remediation actions."""
         executed_actions = []
         
-        # Sort actions by priority
         priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        sorted_actions = sorted(actions, key=lambda x: priority_order.get(x['priority'], 999))
+        
+        # Keep only the most urgent action per (type, service)
+        best_actions = {}
+        for action in actions:
+            key = (action['type'], action['service'])
+            current = best_actions.get(key)
+            if current is None or (priority_order.get(action['priority'], 999)
+                                   < priority_order.get(current['priority'], 999)):
+                best_actions[key] = action
+        
+        # Two-phase plan: cookie refreshes first, then everything else by priority
+        sorted_actions = sorted(
+            best_actions.values(),
+            key=lambda x: (x['type'] != 'cookie_refresh', priority_order.get(x['priority'], 999))
+        )
+        failed_refresh_services = set()
         
         for action in sorted_actions:
             result = {
@@ -469,6 +761,13 @@ class PipelineHealthMonitor:
                 'timestamp': datetime.now().isoformat()
             }
             
+            # Don't run extractors/cleaners on stale data after a failed refresh
+            if action['type'] != 'cookie_refresh' and action['service'] in failed_refresh_services:
+                result['message'] = f"Skipped {action['type']}: cookie refresh failed for {action['service']}"
+                executed_actions.append(result)
+                self.remediation_log.append(result)
+                continue
+            
             try:
                 if action['type'] == 'cookie_refresh' and self.cookie_manager:
                     # Attempt automatic cookie refresh
@@ -524,6 +823,9 @@ class PipelineHealthMonitor:
                 result['success'] = False
                 result['message'] = str(e)
             
+            if action['type'] == 'cookie_refresh' and result['executed'] and not result['success']:
+                failed_refresh_services.add(action['service'])
+            
             executed_actions.append(result)
             self.remediation_log.append(result)
         
@@ -597,30 +899,36 @@ class PipelineHealthMonitor:
             HealthStatus.FAILED.value: "[FAIL]"
         }
         
-        print("\n" + "="*80)
-        print("BEDROT DATA PIPELINE HEALTH REPORT - ACTIVE MANAGEMENT SYSTEM")
-        print(f"Generated: {datetime.fromisoformat(report['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Overall Status: {status_indicators.get(report['overall_status'], '[??]')} {report['overall_status']}")
-        print(f"Auto-Remediation: {'ENABLED' if report['auto_remediation_enabled'] else 'DISABLED'}")
-        print("="*80)
+        # Build the whole report in memory and emit it with a single write
+        buf = io.StringIO()
+        buf.write("\n" + "="*80 + "\n")
+        buf.write("BEDROT DATA PIPELINE HEALTH REPORT - ACTIVE MANAGEMENT SYSTEM\n")
+        buf.write(f"Generated: {report['timestamp'][:19].replace('T', ' ')}\n")
+        buf.write(f"Overall Status: {status_indicators.get(report['overall_status'], '[??]')} {report['overall_status']}\n")
+        buf.write(f"Auto-Remediation: {'ENABLED' if report['auto_remediation_enabled'] else 'DISABLED'}\n")
+        buf.write("="*80 + "\n")
         
         # Priority services first
-        print("\nSERVICE HEALTH SUMMARY (Sorted by Priority)")
-        print("-"*80)
-        print(f"{'Service':12} {'Status':8} {'Score':6} {'Priority':10} {'Issues':30}")
-        print("-"*80)
+        buf.write("\nSERVICE HEALTH SUMMARY (Sorted by Priority)\n")
+        buf.write("-"*80 + "\n")
+        buf.write(f"{'Service':12} {'Status':8} {'Score':6} {'Priority':10} {'Issues':30}\n")
+        buf.write("-"*80 + "\n")
         
-        # Sort services by priority and health score
-        sorted_services = sorted(
-            report['services'].items(),
-            key=lambda x: (self.service_priority.get(x[0], ServicePriority.LOW).value, -x[1]['health_score'])
-        )
+        # Single pass over services: summary rows, critical details and healthy tally
+        summary_rows = []
+        critical_services = []
+        healthy_count = 0
         
-        for service, data in sorted_services:
+        for service, data in report['services'].items():
             score = data['health_score']
             status = data['status']
             priority = data['priority']
             
+            if status == _HEALTHY_VAL:
+                healthy_count += 1
+            elif status in CRITICAL_STATES:
+                critical_services.append((service, data))
+            
             # Build issues string
             issues = []
             if data['cookie_health']['status'] == 'expired':
@@ -640,208 +948,143 @@ class PipelineHealthMonitor:
             
             issues_str = ", ".join(issues) if issues else "No issues"
             
-            print(f"{service:12} {status_indicators.get(status, '[??]'):8} {score:3}%   {priority:10} {issues_str:30}")
+            sort_key = (self.service_priority.get(service, ServicePriority.LOW).value, -score)
+            summary_rows.append((sort_key, f"{service:12} {status_indicators.get(status, '[??]'):8} {score:3}%   {priority:10} {issues_str:30}\n"))
+        
+        # Sort services by priority and health score
+        summary_rows.sort(key=lambda row: row[0])
+        buf.write(''.join(line for _, line in summary_rows))
         
         # Remediation actions taken
         if report.get('remediation_actions'):
-            print("\nAUTO-REMEDIATION ACTIONS")
-            print("-"*80)
+            buf.write("\nAUTO-REMEDIATION ACTIONS\n")
+            buf.write("-"*80 + "\n")
             
             for action in report['remediation_actions']:
                 if isinstance(action, dict) and action.get('executed'):
                     status = "SUCCESS" if action['success'] else "FAILED"
-                    print(f"  [{status}] {action['message']}")
+                    buf.write(f"  [{status}] {action['message']}\n")
                 elif isinstance(action, dict) and 'type' in action:
                     # This is a raw action that wasn't executed
-                    print(f"  [PENDING] {action['type']} for {action['service']}")
+                    buf.write(f"  [PENDING] {action['type']} for {action['service']}\n")
         
         # Detailed issues for critical/failed services
-        critical_services = [(s, d) for s, d in report['services'].items() 
-                           if d['status'] in [HealthStatus.CRITICAL.value, HealthStatus.FAILED.value]]
-        
         if critical_services:
-            print("\nCRITICAL SERVICE DETAILS")
-            print("-"*80)
+            buf.write("\nCRITICAL SERVICE DETAILS\n")
+            buf.write("-"*80 + "\n")
             
             for service, data in critical_services:
-                print(f"\n{service.upper()} [{data['priority']} PRIORITY]:")
+                buf.write(f"\n{service.upper()} [{data['priority']} PRIORITY]:\n")
                 
                 # Cookie status
                 cookie_status = data['cookie_health']['status']
                 if cookie_status in ['expired', 'missing']:
-                    print(f"  - Cookies: {cookie_status.upper()}")
+                    buf.write(f"  - Cookies: {cookie_status.upper()}\n")
                     if cookie_status == 'expired':
                         days_expired = data['cookie_health']['days_old'] - data['cookie_health']['max_age']
-                        print(f"    Expired: {days_expired} days ago")
-                        print(f"    Action: Immediate refresh required")
+                        buf.write(f"    Expired: {days_expired} days ago\n")
+                        buf.write(f"    Action: Immediate refresh required\n")
                     elif data['cookie_health'].get('expires_in', 999) <= 3:
-                        print(f"    Warning: Expires in {data['cookie_health']['expires_in']} days")
+                        buf.write(f"    Warning: Expires in {data['cookie_health']['expires_in']} days\n")
                 
                 # Data freshness
                 if data['freshness']['landing']['days_old'] is not None:
                     days_old = data['freshness']['landing']['days_old']
                     if days_old > 3:
-                        print(f"  - Data Age: {days_old} days old")
-                        print(f"    Latest: {data['freshness']['landing']['latest_file']}")
-                        print(f"    Action: Run extractor immediately")
+                        buf.write(f"  - Data Age: {days_old} days old\n")
+                        buf.write(f"    Latest: {data['freshness']['landing']['latest_file']}\n")
+                        buf.write(f"    Action: Run extractor immediately\n")
                 
                 # Bottlenecks
                 if data['bottlenecks']:
-                    print("  - Pipeline Bottlenecks:")
+                    buf.write("  - Pipeline Bottlenecks:\n")
                     for bottleneck in data['bottlenecks']:
-                        print(f"    • {bottleneck}")
+                        buf.write(f"    • {bottleneck}\n")
         
         # Manual action items
-        print("\nMANUAL ACTION ITEMS (Sorted by Priority)")
-        print("-"*80)
-        
-        # Group recommendations by urgency
-        urgent_recs = []
-        normal_recs = []
+        buf.write("\nMANUAL ACTION ITEMS (Sorted by Priority)\n")
+        buf.write("-"*80 + "\n")
         
-        for service, data in report['services'].items():
-            for rec in data['recommendations']:
-                full_rec = f"[{service}] {rec}"
-                if 'URGENT' in rec or data['status'] in [HealthStatus.CRITICAL.value, HealthStatus.FAILED.value]:
-                    urgent_recs.append(full_rec)
-                else:
-                    normal_recs.append(full_rec)
-        
-        if urgent_recs:
-            print("\nURGENT:")
-            for rec in urgent_recs:
-                print(f"  !!! {rec}")
+        # Recommendations are grouped by urgency in generate_report
+        urgent_actions, normal_actions = _action_buckets(report)
+        if urgent_actions:
+            buf.write("\nURGENT:\n")
+            for service, rec in urgent_actions:
+                buf.write(f"  !!! [{service}] {rec}\n")
         
-        if normal_recs:
-            print("\nRECOMMENDED:")
-            for rec in normal_recs:
-                print(f"  • {rec}")
+        if normal_actions:
+            buf.write("\nRECOMMENDED:\n")
+            for service, rec in normal_actions:
+                buf.write(f"  • [{service}] {rec}\n")
         
         # Save reports in multiple formats
-        self._save_reports(report)
+        self._save_reports(report, out=buf)
         
         # Print summary footer
-        print("\n" + "="*80)
-        healthy_count = sum(1 for s in report['services'].values() if s['status'] == HealthStatus.HEALTHY.value)
+        buf.write("\n" + "="*80 + "\n")
         total_count = len(report['services'])
-        print(f"Summary: {healthy_count}/{total_count} services healthy")
+        buf.write(f"Summary: {healthy_count}/{total_count} services healthy\n")
         
-        if report['overall_status'] in [HealthStatus.CRITICAL.value, HealthStatus.FAILED.value]:
-            print("\n!!! IMMEDIATE ACTION REQUIRED !!!")
-            print("Run manual authentication for failed services or enable auto-remediation")
+        if report['overall_status'] in CRITICAL_STATES:
+            buf.write("\n!!! IMMEDIATE ACTION REQUIRED !!!\n")
+            buf.write("Run manual authentication for failed services or enable auto-remediation\n")
+        
+        sys.stdout.write(buf.getvalue())
     
-    def _save_reports(self, report: Dict):
-        """Save reports in multiple formats."""
+    def _save_reports(self, report: Dict, out=None):
+        """Save reports in multiple formats, listing the saved paths on ``out``."""
+        out = out if out is not None else sys.stdout
+        
         # JSON report
         json_file = self.project_root / 'pipeline_health_report.json'
-        with open(json_file, 'w') as f:
-            json.dump(report, f, indent=2)
-        print(f"\nReports saved:")
-        print(f"  - JSON: {json_file}")
+        with open(json_file, 'wb', buffering=1 << 16) as f:
+            write_report_json(report, f)
+        out.write("\nReports saved:\n")
+        out.write(f"  - JSON: {json_file}\n")
         
         # HTML report
-        html_file = self.project_root / 'pipeline_health_report.html'
-        self._generate_html_report(report, html_file)
-        print(f"  - HTML: {html_file}")
+        if self.enable_html:
+            html_file = self.project_root / 'pipeline_health_report.html'
+            self._generate_html_report(report, html_file)
+            out.write(f"  - HTML: {html_file}\n")
     
     def _generate_html_report(self, report: Dict, output_path: Path):
         """Generate an HTML report with visual dashboard."""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>BEDROT Pipeline Health Report</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        h1, h2 {{ color: #333; }}
-        .status-badge {{ display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: bold; color: white; }}
-        .status-healthy {{ background: #28a745; }}
-        .status-warning {{ background: #ffc107; color: #333; }}
-        .status-critical {{ background: #dc3545; }}
-        .status-failed {{ background: #6c757d; }}
-        .service-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .service-card {{ border: 1px solid #ddd; border-radius: 8px; padding: 15px; }}
-        .service-card.critical {{ border-color: #dc3545; background: #f8d7da; }}
-        .service-card.warning {{ border-color: #ffc107; background: #fff3cd; }}
-        .service-card.healthy {{ border-color: #28a745; background: #d4edda; }}
-        .metric {{ margin: 10px 0; }}
-        .metric-label {{ font-weight: bold; color: #666; }}
-        .action-item {{ margin: 5px 0; padding: 8px; background: #e9ecef; border-radius: 4px; }}
-        .urgent {{ background: #f8d7da; border-left: 4px solid #dc3545; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f8f9fa; font-weight: bold; }}
-        .timestamp {{ color: #666; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>BEDROT Pipeline Health Report</h1>
-        <p class="timestamp">Generated: {datetime.fromisoformat(report['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div style="margin: 20px 0; padding: 15px; background: #{'#d4edda' if report['overall_status'] == 'HEALTHY' else '#f8d7da' if report['overall_status'] in ['CRITICAL', 'FAILED'] else '#fff3cd'}; border-radius: 8px;">
-            <h2 style="margin: 0;">Overall Status: <span class="status-badge status-{report['overall_status'].lower()}">{report['overall_status']}</span></h2>
-            <p style="margin: 10px 0 0 0;">Auto-Remediation: <strong>{'Enabled' if report['auto_remediation_enabled'] else 'Disabled'}</strong></p>
-        </div>
-        
-        <h2>Service Health Overview</h2>
-        <div class="service-grid">
-"""
+        overall_status = report['overall_status']
+        # Collect fragments and join once instead of growing a string with +=
+        parts = [_HTML_HEAD.format_map({
+            'timestamp': report['timestamp'][:19].replace('T', ' '),
+            'overall_bg': _STATUS_BG.get(overall_status, '#fff3cd'),
+            'overall_class': _STATUS_CLASS[overall_status],
+            'overall_status': overall_status,
+            'auto_remediation': 'Enabled' if report['auto_remediation_enabled'] else 'Disabled',
+        })]
         
         # Add service cards
-        for service, data in report['services'].items():
-            status_class = data['status'].lower()
-            html_content += f"""
-            <div class="service-card {status_class}">
-                <h3>{service.upper()} <span class="status-badge status-{status_class}">{data['health_score']}%</span></h3>
-                <div class="metric">
-                    <span class="metric-label">Priority:</span> {data['priority']}
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Cookie Status:</span> {data['cookie_health']['status']}
-                    {f" (expires in {data['cookie_health'].get('expires_in', 'N/A')} days)" if data['cookie_health']['status'] == 'valid' else ''}
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Data Age:</span> 
-                    {f"{data['freshness']['landing']['days_old']} days" if data['freshness']['landing']['days_old'] is not None else 'No data'}
-                </div>
-                {f'<div class="metric"><span class="metric-label">Bottlenecks:</span> {len(data["bottlenecks"])}</div>' if data['bottlenecks'] else ''}
-            </div>
-"""
+        parts.append(''.join(_render_card(service, data) for service, data in report['services'].items()))
         
         # Add action items
-        urgent_actions = []
-        normal_actions = []
+        urgent_actions, normal_actions = _action_buckets(report)
         
-        for service, data in report['services'].items():
-            for rec in data['recommendations']:
-                if 'URGENT' in rec or data['status'] in ['CRITICAL', 'FAILED']:
-                    urgent_actions.append((service, rec))
-                else:
-                    normal_actions.append((service, rec))
-        
-        html_content += """
+        parts.append("""
         </div>
         
         <h2>Action Items</h2>
-"""
+""")
         
         if urgent_actions:
-            html_content += "<h3>Urgent Actions Required</h3>"
+            parts.append("<h3>Urgent Actions Required</h3>")
             for service, action in urgent_actions:
-                html_content += f'<div class="action-item urgent"><strong>[{service}]</strong> {action}</div>'
+                parts.append(f'<div class="action-item urgent"><strong>[{service}]</strong> {action}</div>')
         
         if normal_actions:
-            html_content += "<h3>Recommended Actions</h3>"
+            parts.append("<h3>Recommended Actions</h3>")
             for service, action in normal_actions:
-                html_content += f'<div class="action-item"><strong>[{service}]</strong> {action}</div>'
+                parts.append(f'<div class="action-item"><strong>[{service}]</strong> {action}</div>')
         
         # Add remediation log if present
         if report.get('remediation_actions'):
-            html_content += """
+            parts.append("""
         <h2>Auto-Remediation Log</h2>
         <table>
             <tr>
@@ -850,29 +1093,25 @@ class PipelineHealthMonitor:
                 <th>Status</th>
                 <th>Message</th>
             </tr>
-"""
+""")
             for action in report['remediation_actions']:
                 if action.get('executed'):
                     status = 'Success' if action['success'] else 'Failed'
-                    html_content += f"""
+                    parts.append(f"""
             <tr>
                 <td>{action['action']['service']}</td>
                 <td>{action['action']['type']}</td>
                 <td><span class="status-badge status-{'healthy' if action['success'] else 'critical'}">{status}</span></td>
                 <td>{action['message']}</td>
             </tr>
-"""
+""")
             
-            html_content += "</table>"
+            parts.append("</table>")
         
-        html_content += """
-    </div>
-</body>
-</html>
-"""
+        parts.append(_HTML_TAIL)
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
 
 
 def main():
@@ -886,6 +1125,8 @@ def main():
                        help='Disable notifications')
     parser.add_argument('--json-only', '-j', action='store_true',
                        help='Output JSON report only, no console output')
+    parser.add_argument('--no-html', action='store_true',
+                       help='Skip writing the HTML report')
     parser.add_argument('--service', '-s', help='Check specific service only')
     parser.add_argument('--fix-issues', '-f', action='store_true',
                        help='Automatically fix all detected issues (implies --auto-remediate)')
@@ -898,7 +1139,8 @@ def main():
     
     monitor = PipelineHealthMonitor(
         enable_auto_remediation=enable_auto,
-        enable_notifications=enable_notif
+        enable_notifications=enable_notif,
+        enable_html=not args.no_html
     )
     
     # Filter services if specified
@@ -914,7 +1156,10 @@ def main():
     
     # Output based on options
     if args.json_only:
-        print(json.dumps(report, indent=2))
+        sys.stdout.flush()
+        write_report_json(report, sys.stdout.buffer)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
     else:
         monitor.print_report(report)
     
@@ -8,9 +8,15 @@ import os
 import sys
 import json
 import subprocess
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
 # Service configuration
 AUTH_SERVICES = {
@@ -59,52 +65,88 @@ AUTH_SERVICES = {
     }
 }
 
+# Upper bound on services extracting concurrently
+MAX_PARALLEL_SERVICES = 6
+
+# Resolved once at import rather than on every check
+_PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT") or Path(__file__).resolve().parents[2])
+_AUTOMATED_MODE = os.getenv("AUTOMATED_MODE", "false").lower() == "true"
+_SRC_ROOT_STR = str(_PROJECT_ROOT / "src")
+_COOKIE_DIRS = {svc: os.path.join(_SRC_ROOT_STR, svc, "cookies") for svc in AUTH_SERVICES}
+
+# Absolute script paths so subprocesses don't depend on the caller's cwd
+for _cfg in AUTH_SERVICES.values():
+    _cfg["manual_script_abs"] = str(_PROJECT_ROOT / _cfg["manual_script"])
+    _cfg["automated_scripts_abs"] = [str(_PROJECT_ROOT / s) for s in _cfg["automated_scripts"]]
+
+
+def _is_expired(cookie: dict, now: float) -> bool:
+    """Return True if a persistent (non-session) cookie expired before ``now``."""
+    return 0 < cookie.get("expires", 0) < now
+
+
+def _has_expired_cookie(cookies: list, now: float) -> bool:
+    """Return True as soon as one expired cookie is found."""
+    return any(_is_expired(cookie, now) for cookie in cookies)
+
+
+def _count_expired_cookies(cookies: list, now: float) -> int:
+    """Count expired cookies, for diagnostics."""
+    return sum(1 for cookie in cookies if _is_expired(cookie, now))
+
 
 def check_cookie_freshness(service: str) -> tuple[bool, str, int]:
     """
     Check if cookies for a service are fresh enough.
     Returns (is_fresh, reason, days_old)
     """
-    project_root = Path(os.getenv("PROJECT_ROOT", Path(__file__).resolve().parents[2]))
     # Cookies are stored in each service's cookies directory
-    cookie_file = project_root / "src" / service / "cookies" / f"{service}_cookies.json"
+    # (plain strings: this runs per service and never needs Path methods)
+    cookie_dir = _COOKIE_DIRS[service]
+    cookie_file = os.path.join(cookie_dir, f"{service}_cookies.json")
     
     # Special case for TikTok - check for multiple cookie files
-    if service == "tiktok":
-        cookie_dir = project_root / "src" / service / "cookies"
-        if cookie_dir.exists():
-            cookie_files = list(cookie_dir.glob("tiktok_cookies_*.json"))
-            if cookie_files:
-                # Use the most recently modified cookie file
-                cookie_file = max(cookie_files, key=lambda f: f.stat().st_mtime)
+    if service == "tiktok" and os.path.isdir(cookie_dir):
+        # Use the most recently modified cookie file; DirEntry caches its stat
+        newest_path = None
+        newest_mtime = -1.0
+        with os.scandir(cookie_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("tiktok_cookies_") and entry.name.endswith(".json"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > newest_mtime:
+                        newest_path, newest_mtime = entry.path, mtime
+        if newest_path:
+            cookie_file = newest_path
     
-    if not cookie_file.exists():
+    try:
+        cookie_stat = os.stat(cookie_file)
+    except FileNotFoundError:
         return False, "Cookie file does not exist", -1
     
     try:
-        # Check file age
-        file_age = datetime.now() - datetime.fromtimestamp(cookie_file.stat().st_mtime)
-        days_old = file_age.days
+        # Check file age before paying for a JSON parse
+        days_old = int((time.time() - cookie_stat.st_mtime) // 86400)
         max_age = AUTH_SERVICES[service]["cookie_max_age_days"]
         
         if days_old > max_age:
             return False, f"Cookies are {days_old} days old (max: {max_age})", days_old
         
+        # An empty file, "[]" or "{}" can't hold any cookies
+        if cookie_stat.st_size <= 2:
+            return False, "Cookie file is empty", days_old
+        
         # Check cookie content
-        with open(cookie_file) as f:
-            cookies = json.load(f)
+        with open(cookie_file, "rb") as f:
+            cookies = orjson.loads(f.read()) if orjson is not None else json.load(f)
         
         if not cookies:
             return False, "Cookie file is empty", days_old
         
-        # Check for expired cookies
-        now = datetime.now().timestamp()
-        expired_count = 0
-        for cookie in cookies:
-            if "expires" in cookie and cookie["expires"] > 0 and cookie["expires"] < now:
-                expired_count += 1
-        
-        if expired_count > 0:
+        # Check for expired cookies (only count them when reporting a failure)
+        now = time.time()
+        if _has_expired_cookie(cookies, now):
+            expired_count = _count_expired_cookies(cookies, now)
             return False, f"{expired_count} cookies have expired", days_old
         
         return True, f"Cookies are {days_old} days old and valid", days_old
@@ -123,20 +165,20 @@ def run_manual_auth(service: str) -> bool:
         return False
     
     manual_script = AUTH_SERVICES[service]["manual_script"]
+    manual_script_abs = AUTH_SERVICES[service]["manual_script_abs"]
     
     print("\n" + "="*70)
     print(f"MANUAL AUTHENTICATION REQUIRED FOR {service.upper()}")
     print("="*70)
-    print(f"Running: python {manual_script}")
+    print(f"Running: {Path(sys.executable).name} {manual_script}")
     print("Please complete the login process in the browser window.")
     print("="*70 + "\n")
     
     try:
         # Run the manual authentication script
         result = subprocess.run(
-            f"python {manual_script}",
-            shell=True,
-            cwd=os.getenv("PROJECT_ROOT"),
+            [sys.executable, manual_script_abs],
+            cwd=str(_PROJECT_ROOT),
             capture_output=False  # Allow interactive input/output
         )
         
@@ -163,28 +205,33 @@ def run_automated_extractors(service: str) -> bool:
     
     all_success = True
     
-    for script in AUTH_SERVICES[service]["automated_scripts"]:
+    config = AUTH_SERVICES[service]
+    for script, script_abs in zip(config["automated_scripts"], config["automated_scripts_abs"]):
         print(f"\n[AUTH] Running automated extractor: {script}")
         
+        if not os.path.isfile(script_abs):
+            print(f"[AUTH] ❌ {script} not found")
+            all_success = False
+            continue
+        
         try:
+            # Capture raw bytes and decode only what we actually print
             result = subprocess.run(
-                f"python {script}",
-                shell=True,
-                cwd=os.getenv("PROJECT_ROOT"),
-                capture_output=True,
-                text=True
+                [sys.executable, script_abs],
+                cwd=str(_PROJECT_ROOT),
+                capture_output=True
             )
             
             if result.returncode == 0:
                 print(f"[AUTH] ✅ {script} completed successfully")
                 if result.stdout:
-                    print(result.stdout)
+                    print(result.stdout.decode("utf-8", errors="replace"))
             else:
                 print(f"[AUTH] ❌ {script} failed with code {result.returncode}")
                 if result.stderr:
-                    print("STDERR:", result.stderr)
+                    print("STDERR:", result.stderr.decode("utf-8", errors="replace"))
                 if result.stdout:
-                    print("STDOUT:", result.stdout)
+                    print("STDOUT:", result.stdout.decode("utf-8", errors="replace"))
                 all_success = False
                 
         except Exception as e:
@@ -194,10 +241,10 @@ def run_automated_extractors(service: str) -> bool:
     return all_success
 
 
-def check_and_run_service(service: str, force_manual: bool = False) -> bool:
+def ensure_service_auth(service: str, force_manual: bool = False) -> bool:
     """
-    Check authentication status and run extractors for a service.
-    Returns True if successful.
+    Check authentication status for a service, prompting for manual auth if needed.
+    Returns True if the service is ready for automated extraction.
     """
     print(f"\n{'='*70}")
     print(f"Processing {service.upper()}")
@@ -219,7 +266,7 @@ def check_and_run_service(service: str, force_manual: bool = False) -> bool:
                 print(f"\n[AUTH] ⚠️  Cookies for {service} need refresh")
                 
                 # In automated mode, skip services with expired cookies
-                if os.getenv("AUTOMATED_MODE", "false").lower() == "true":
+                if _AUTOMATED_MODE:
                     print(f"[AUTH] Skipping {service} - manual authentication required")
                     return False
                 
@@ -234,7 +281,7 @@ def check_and_run_service(service: str, force_manual: bool = False) -> bool:
             else:
                 # No cookies at all
                 print(f"[AUTH] No cookies found for {service}")
-                if os.getenv("AUTOMATED_MODE", "false").lower() == "true":
+                if _AUTOMATED_MODE:
                     print(f"[AUTH] Skipping {service} - no cookies available")
                     return False
                 
@@ -246,6 +293,17 @@ def check_and_run_service(service: str, force_manual: bool = False) -> bool:
                     print(f"[AUTH] Skipping {service} extractors")
                     return False
     
+    return True
+
+
+def check_and_run_service(service: str, force_manual: bool = False) -> bool:
+    """
+    Check authentication status and run extractors for a service.
+    Returns True if successful.
+    """
+    if not ensure_service_auth(service, force_manual=force_manual):
+        return False
+    
     # Run automated extractors
     return run_automated_extractors(service)
 
@@ -287,13 +345,29 @@ def main():
         
         return 0
     
-    # Process each service
+    # Resolve authentication one service at a time, since it may prompt
     failed_services = []
+    ready_services = []
     
     for service in services:
-        if not check_and_run_service(service, force_manual=args.manual):
+        if ensure_service_auth(service, force_manual=args.manual):
+            ready_services.append(service)
+        else:
             failed_services.append(service)
     
+    # Extractors are I/O-bound (browser/network), so run services in parallel
+    if ready_services:
+        with ThreadPoolExecutor(max_workers=min(len(ready_services), MAX_PARALLEL_SERVICES)) as executor:
+            futures = {executor.submit(run_automated_extractors, s): s for s in ready_services}
+            for future in as_completed(futures):
+                try:
+                    succeeded = future.result()
+                except Exception as e:
+                    print(f"[AUTH] ❌ Error running {futures[future]} extractors: {e}")
+                    succeeded = False
+                if not succeeded:
+                    failed_services.append(futures[future])
+    
     # Summary
     print("\n" + "="*70)
     print("EXTRACTION SUMMARY")
@@ -11,10 +11,12 @@ Runs periodic health checks and takes automated actions:
 
 import os
 import sys
-import json
+import shutil
 import schedule
+import threading
 import time
 import argparse
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -22,15 +24,22 @@ from typing import Dict, Any, List, Optional
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from pipeline_health_monitor import PipelineHealthMonitor, HealthStatus
-from cookie_refresh.dashboard import CookieRefreshDashboard
-from cookie_refresh.notifier import CookieRefreshNotifier, NotificationLevel
-from cookie_refresh.config_loader import load_config
+from pipeline_health_monitor import PipelineHealthMonitor, HealthStatus, dump_report_json
 from logging_config import setup_logging, get_logger
 
+# Cookie refresh dashboard/notifier are imported in ScheduledHealthChecker.__init__
+# so importing this module (or running --help) skips their setup cost.
+NotificationLevel = None  # Bound on first ScheduledHealthChecker
+
 # Set up logging
 logger = get_logger('pipeline.health.scheduler')
 
+# Upper bound on a single scheduler sleep so the loop stays responsive
+MAX_IDLE_WAIT_S = 300
+
+# Rebuild the dashboard at least this often even when status is unchanged
+DASHBOARD_REFRESH_S = 3600
+
 
 class ScheduledHealthChecker:
     """Orchestrates scheduled health checks and automated actions."""
@@ -46,6 +55,11 @@ class ScheduledHealthChecker:
         self.enable_auto_fix = enable_auto_fix
         self.project_root = Path(os.environ.get('PROJECT_ROOT', Path(__file__).resolve().parents[2]))
         
+        global NotificationLevel
+        from cookie_refresh.dashboard import CookieRefreshDashboard
+        from cookie_refresh.notifier import CookieRefreshNotifier, NotificationLevel
+        from cookie_refresh.config_loader import load_config
+        
         # Initialize components
         self.monitor = PipelineHealthMonitor(
             enable_auto_remediation=enable_auto_fix,
@@ -61,8 +75,13 @@ class ScheduledHealthChecker:
         # Track state
         self.last_check_time = None
         self.last_report = None
-        self.check_history = []
+        self.check_history = deque(maxlen=100)
         self.daily_summary_sent = False
+        self._stop_event = threading.Event()
+        self._last_dashboard_status = None
+        self._last_dashboard_ts = 0.0
+        # Notifications raised during a check cycle, sent together at its end
+        self._pending_notifications: List[Dict[str, Any]] = []
     
     def run_health_check(self):
         """Execute a health check cycle."""
@@ -77,6 +96,7 @@ class ScheduledHealthChecker:
             # Store check result
             check_result = {
                 'timestamp': report['timestamp'],
+                'checked_at': self.last_check_time,  # parsed once for the daily summary
                 'overall_status': report['overall_status'],
                 'services_count': len(report['services']),
                 'critical_count': sum(1 for s in report['services'].values() 
@@ -86,10 +106,6 @@ class ScheduledHealthChecker:
             
             self.check_history.append(check_result)
             
-            # Limit history size
-            if len(self.check_history) > 100:
-                self.check_history = self.check_history[-50:]
-            
             # Log summary
             logger.info(
                 f"Health check complete: {report['overall_status']} "
@@ -105,19 +121,30 @@ class ScheduledHealthChecker:
             # Save report
             self._save_report(report)
             
-            # Update dashboard
-            self.dashboard.generate_dashboard(auto_open=False)
+            # Update dashboard when status changed or it has gone stale
+            self._maybe_update_dashboard(report)
             
         except Exception as e:
             logger.error(f"Error during health check: {e}", exc_info=True)
             
             # Send error notification
-            self.notifier.send_custom_notification(
+            self._pending_notifications.append(dict(
                 level=NotificationLevel.ERROR,
                 message=f"Health check failed: {str(e)}",
                 service="HEALTH_MONITOR",
                 details={'error': str(e)}
-            )
+            ))
+        
+        finally:
+            self._flush_notifications()
+    
+    def _flush_notifications(self):
+        """Send this cycle's queued notifications as one batch."""
+        pending, self._pending_notifications = self._pending_notifications, []
+        try:
+            self.notifier.send_batch(pending)
+        except Exception as e:
+            logger.error(f"Error sending notifications: {e}", exc_info=True)
     
     def _handle_critical_status(self, report: Dict[str, Any]):
         """Handle critical pipeline status."""
@@ -129,8 +156,8 @@ class ScheduledHealthChecker:
         # Build notification message
         message_parts = [f"{name} ({data['status']})" for name, data in critical_services]
         
-        # Send critical notification
-        self.notifier.send_custom_notification(
+        # Queue critical notification
+        self._pending_notifications.append(dict(
             level=NotificationLevel.CRITICAL,
             message=f"Pipeline critical: {', '.join(message_parts)}",
             service="HEALTH_MONITOR",
@@ -139,7 +166,7 @@ class ScheduledHealthChecker:
                 'overall_status': report['overall_status'],
                 'auto_remediation': 'Enabled' if self.enable_auto_fix else 'Disabled'
             }
-        )
+        ))
         
         # Log critical issues
         for service_name, service_data in critical_services:
@@ -157,8 +184,8 @@ class ScheduledHealthChecker:
         ]
         
         if warning_services:
-            # Send warning notification
-            self.notifier.send_custom_notification(
+            # Queue warning notification
+            self._pending_notifications.append(dict(
                 level=NotificationLevel.WARNING,
                 message=f"Pipeline warnings for: {', '.join(warning_services)}",
                 service="HEALTH_MONITOR",
@@ -166,7 +193,7 @@ class ScheduledHealthChecker:
                     'warning_services': warning_services,
                     'overall_status': report['overall_status']
                 }
-            )
+            ))
     
     def _save_report(self, report: Dict[str, Any]):
         """Save health report to file."""
@@ -178,16 +205,34 @@ class ScheduledHealthChecker:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_file = reports_dir / f'health_report_{timestamp}.json'
         
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Serialize once and rename into place so readers never see a
+        # half-written report
+        tmp_file = report_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(dump_report_json(report))
+        os.replace(tmp_file, report_file)
         
-        # Also save as latest
+        # Also save as latest, hard-linking the same bytes when possible
         latest_file = reports_dir / 'latest_health_report.json'
-        with open(latest_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        latest_tmp = latest_file.with_suffix('.json.tmp')
+        latest_tmp.unlink(missing_ok=True)
+        try:
+            os.link(report_file, latest_tmp)
+        except OSError:
+            shutil.copyfile(report_file, latest_tmp)
+        os.replace(latest_tmp, latest_file)
         
         logger.debug(f"Health report saved to {report_file}")
     
+    def _maybe_update_dashboard(self, report: Dict[str, Any]):
+        """Regenerate the dashboard only on a status change or hourly."""
+        now = time.monotonic()
+        if (report['overall_status'] == self._last_dashboard_status
+                and now - self._last_dashboard_ts < DASHBOARD_REFRESH_S):
+            return
+        self.dashboard.generate_dashboard(auto_open=False)
+        self._last_dashboard_status = report['overall_status']
+        self._last_dashboard_ts = now
+    
     def generate_daily_summary(self):
         """Generate and send daily summary report."""
         logger.info("Generating daily summary report")
@@ -243,12 +288,21 @@ This is an automated daily summary from the BEDROT Pipeline Health Monitor.
         """Compile statistics for daily summary."""
         # Get checks from last 24 hours
         cutoff_time = datetime.now() - timedelta(days=1)
-        recent_checks = [
-            check for check in self.check_history
-            if datetime.fromisoformat(check['timestamp']) > cutoff_time
-        ]
         
-        if not recent_checks:
+        # Tally in one newest-first pass; history is chronological so we can
+        # stop at the first check older than the cutoff
+        total_checks = critical_incidents = warnings = auto_remediations = 0
+        for check in reversed(self.check_history):
+            if check['checked_at'] <= cutoff_time:
+                break
+            total_checks += 1
+            if check['overall_status'] in ('CRITICAL', 'FAILED'):
+                critical_incidents += 1
+            elif check['overall_status'] == 'WARNING':
+                warnings += 1
+            auto_remediations += check.get('remediation_count', 0)
+        
+        if not total_checks:
             return {
                 'total_checks': 0,
                 'avg_health_score': 0,
@@ -257,14 +311,6 @@ This is an automated daily summary from the BEDROT Pipeline Health Monitor.
                 'auto_remediations': 0
             }
         
-        # Calculate statistics
-        total_checks = len(recent_checks)
-        critical_incidents = sum(1 for c in recent_checks 
-                               if c['overall_status'] in ['CRITICAL', 'FAILED'])
-        warnings = sum(1 for c in recent_checks 
-                      if c['overall_status'] == 'WARNING')
-        auto_remediations = sum(c.get('remediation_count', 0) for c in recent_checks)
-        
         # Calculate average health score from latest report
         avg_health_score = 0
         if self.last_report and 'services' in self.last_report:
@@ -316,25 +362,38 @@ This is an automated daily summary from the BEDROT Pipeline Health Monitor.
         # Schedule daily summary at 9 AM
         schedule.every().day.at("09:00").do(self.generate_daily_summary)
         
+        # Reset daily summary flag at midnight
+        schedule.every().day.at("00:00").do(self._reset_daily_summary)
+        
         # Run initial check
         self.run_health_check()
         
-        # Main scheduler loop
+        # Main scheduler loop: sleep until the next job is due instead of
+        # polling on a fixed tick
         try:
-            while True:
+            while not self._stop_event.is_set():
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
                 
-                # Reset daily summary flag at midnight
-                if datetime.now().hour == 0 and self.daily_summary_sent:
-                    self.daily_summary_sent = False
+                wait = schedule.idle_seconds()
+                if wait is None or wait < 0:
+                    wait = 1
+                self._stop_event.wait(min(wait, MAX_IDLE_WAIT_S))
                     
         except KeyboardInterrupt:
+            self._stop_event.set()
             logger.info("Health check scheduler stopped by user")
         except Exception as e:
             logger.error(f"Scheduler error: {e}", exc_info=True)
             raise
     
+    def stop(self):
+        """Wake the scheduler loop and make it exit."""
+        self._stop_event.set()
+    
+    def _reset_daily_summary(self):
+        """Clear the daily summary flag for the new day."""
+        self.daily_summary_sent = False
+    
     def run_once(self):
         """Run a single health check and exit."""
         logger.info("Running single health check")
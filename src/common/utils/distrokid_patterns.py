@@ -0,0 +1,16 @@
+"""Regexes shared by the DistroKid cleaners, compiled once at import.
+
+Patterns are bytes so pages can be matched straight from ``read_bytes()``.
+"""
+import re
+
+# Landing validation: the dashboard pages contain the embedded chart blocks
+STREAMS_BLOCK_RE = re.compile(rb'"trend365day".*?"dataProvider"\s*:\s*\[(.*?)\]', re.DOTALL)
+APPLE_CHART_RE   = re.compile(rb'var\s+chartData\s*=\s*([\s\S]+?);\s*\n', re.MULTILINE)
+
+# Raw → staging extraction: the dataProvider arrays themselves
+STREAMS_RE = re.compile(rb'"id"\s*:\s*"trend365day".+?"dataProvider"\s*:\s*\[([^\]]+)\]', re.DOTALL)
+APPLE_RE   = re.compile(rb'"dataProvider"\s*:\s*\[([^\]]+)\]', re.DOTALL)
+
+# AmCharts arrays often end with a trailing comma that json rejects
+TRAILING_COMMA_RE = re.compile(rb',\s*\]')
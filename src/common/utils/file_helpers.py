@@ -0,0 +1,20 @@
+import os
+import shutil
+from pathlib import Path
+
+
+def place_file(src: Path, dst: Path) -> None:
+    """Make ``dst`` a copy of ``src``, as a hard link when possible.
+
+    ``dst`` is unlinked first, so a previously linked file is never written
+    through. Falls back to ``shutil.copyfile`` (reflink / ``copy_file_range``
+    where the OS supports it) across filesystems or where links are refused.
+    Callers must replace the file via ``place_file`` again rather than
+    rewriting it in place.
+    """
+    dst = Path(dst)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
@@ -2,12 +2,50 @@ import hashlib
 from pathlib import Path
 import pandas as pd
 
+# Read size for hashing files without loading them into memory
+_CHUNK_SIZE = 1 << 20
+
+# Digests are only compared within a run, never persisted, so the algorithm
+# is free to change. SHA-256 uses the CPU's SHA extensions via OpenSSL and
+# outruns MD5 on current hardware.
+HASH_ALGORITHM = "sha256"
+
+
+class _HashWriter:
+    """Minimal text sink that feeds everything written to it into a hash."""
+
+    def __init__(self, h):
+        self._h = h
+
+    def write(self, s: str) -> int:
+        self._h.update(s.encode())
+        return len(s)
+
 
 def df_hash(df: pd.DataFrame) -> str:
-    """Return MD5 hash of DataFrame contents."""
-    return hashlib.md5(df.to_csv(index=False).encode()).hexdigest()
+    """Return hash of DataFrame contents.
+
+    Matches ``file_hash`` of ``df.to_csv(path, index=False)``; the CSV is
+    streamed into the hash rather than built as one string.
+    """
+    h = hashlib.new(HASH_ALGORITHM)
+    df.to_csv(_HashWriter(h), index=False)
+    return h.hexdigest()
+
+
+def bytes_hash(data: bytes) -> str:
+    """Return hash of in-memory bytes, comparable with ``file_hash``."""
+    return hashlib.new(HASH_ALGORITHM, data).hexdigest()
 
 
 def file_hash(path: Path) -> str:
-    """Return MD5 hash of file bytes."""
-    return hashlib.md5(path.read_bytes()).hexdigest()
+    """Return hash of file bytes, read in fixed-size chunks."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, HASH_ALGORITHM).hexdigest()
+        h = hashlib.new(HASH_ALGORITHM)
+        buf = bytearray(_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+    return h.hexdigest()
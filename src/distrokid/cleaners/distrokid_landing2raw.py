@@ -3,10 +3,16 @@
 # Validate DistroKid HTML and TSV files in the landing zone and copy approved
 # files to the raw zone. Requires PROJECT_ROOT and optional LANDING_ZONE/RAW_ZONE
 # environment variables.
-import os, re, json, hashlib, shutil
+import os, re, json, mmap, shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+from common.utils.hash_helpers import bytes_hash, file_hash
+from common.utils.distrokid_patterns import STREAMS_BLOCK_RE, APPLE_CHART_RE
 
 load_dotenv()
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT"))
@@ -16,19 +22,21 @@ RAW          = PROJECT_ROOT / os.getenv("RAW_ZONE",     "raw")
 
 # %%
 # ─── Cell 2: Validation Helpers (HTML & TSV) ────────────────────────────────────
-streams_re = re.compile(r'"trend365day".*?"dataProvider"\s*:\s*\[(.*?)\]', re.DOTALL)
-apple_re   = re.compile(r'var\s+chartData\s*=\s*([\s\S]+?);\s*\n', re.MULTILINE)
-
-def _html_ok(path: Path, pattern: re.Pattern) -> bool:
-    txt = path.read_text(encoding="utf-8", errors="ignore")
-    return bool(pattern.search(txt))
+def _html_ok(path: Path, pattern: re.Pattern, marker: bytes) -> bool:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:                  # mmap rejects empty files
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Literal find first: pages without the marker never reach the lazy
+            # DOTALL regex (mmap's `in` only tests single bytes, hence find)
+            return mm.find(marker) >= 0 and bool(pattern.search(mm))
 
 def validate_streams_html(p: Path):
-    if not _html_ok(p, streams_re): return False, "trend365day block missing"
+    if not _html_ok(p, STREAMS_BLOCK_RE, b'"trend365day"'): return False, "trend365day block missing"
     return True, "OK"
 
 def validate_apple_html(p: Path):
-    if not _html_ok(p, apple_re):   return False, "chartData block missing"
+    if not _html_ok(p, APPLE_CHART_RE, b"chartData"):      return False, "chartData block missing"
     return True, "OK"
 
 def validate_tsv(p: Path):
@@ -43,33 +51,83 @@ finance_dir = RAW  / "distrokid" / "finance"
 raw_dir.mkdir(parents=True, exist_ok=True)
 finance_dir.mkdir(parents=True, exist_ok=True)
 
+_src_hashes = {}  # (path, mtime_ns, size) → digest, so a landing file is hashed once
+
+def _src_hash(src: Path, st: os.stat_result) -> str:
+    key = (str(src), st.st_mtime_ns, st.st_size)
+    if key not in _src_hashes:
+        _src_hashes[key] = file_hash(src)
+    return _src_hashes[key]
+
+def _is_same_file(src: Path, src_st: os.stat_result, dst: Path) -> bool:
+    try:
+        dst_st = dst.stat()
+    except FileNotFoundError:
+        return False
+    if dst_st.st_size != src_st.st_size:                       # cheap: sizes differ
+        return False
+    if dst_st.st_mtime_ns == src_st.st_mtime_ns:               # copy2 kept the mtime
+        return True
+    return file_hash(dst) == _src_hash(src, src_st)
+
+def _fast_copy(src: Path, dst: Path, st: os.stat_result):
+    """Copy bytes in-kernel where possible, keeping src's timestamps."""
+    copy_range = getattr(os, "copy_file_range", None)        # Linux 4.5+
+    try:
+        if copy_range is None:
+            raise OSError
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = st.st_size
+            while remaining > 0:
+                n = copy_range(s.fileno(), d.fileno(), remaining)
+                if n == 0:
+                    break
+                remaining -= n
+    except OSError:
+        shutil.copyfile(src, dst)                              # sendfile / CopyFile fallback
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
 def _copy_if_new(src: Path, dst_dir: Path):
     dst = dst_dir / src.name
-    if dst.exists() and hashlib.md5(dst.read_bytes()).hexdigest() == hashlib.md5(src.read_bytes()).hexdigest():
+    src_st = src.stat()
+    if _is_same_file(src, src_st, dst):
         return False
     if dst.exists():                                           # version duplicate
         ts = datetime.now().strftime("%Y%m%dT%H%M%S")
         dst = dst_dir / f"{src.stem}__{ts}{src.suffix}"
-    shutil.copy2(src, dst)
+    _fast_copy(src, dst, src_st)
+    return True
+
+def _write_if_new(data: bytes, name: str, dst_dir: Path):
+    """Like _copy_if_new, for content produced in memory."""
+    dst = dst_dir / name
+    if dst.exists():
+        if dst.stat().st_size == len(data) and file_hash(dst) == bytes_hash(data):
+            return False
+        ts = datetime.now().strftime("%Y%m%dT%H%M%S")             # version duplicate
+        dst = dst_dir / f"{dst.stem}__{ts}{dst.suffix}"
+    dst.write_bytes(data)
     return True
 
-promoted = []
-for html in src_dir.glob("streams_stats_*.html"):
-    ok, msg = validate_streams_html(html)
-    if ok and _copy_if_new(html, raw_dir): promoted.append(html.name)
+def _promote_html(html: Path, validate):
+    ok, msg = validate(html)
+    return html.name if ok and _copy_if_new(html, raw_dir) else None
 
-for html in src_dir.glob("applemusic_stats_*.html"):
-    ok, msg = validate_apple_html(html)
-    if ok and _copy_if_new(html, raw_dir): promoted.append(html.name)
+# Files are independent, so validate + copy them concurrently
+html_jobs = ([(h, validate_streams_html) for h in src_dir.glob("streams_stats_*.html")] +
+             [(h, validate_apple_html)   for h in src_dir.glob("applemusic_stats_*.html")])
+with ThreadPoolExecutor(max_workers=8) as ex:
+    promoted = [name for name in ex.map(lambda job: _promote_html(*job), html_jobs) if name]
 
 for tsv in src_dir.glob("dk_bank_details_*.tsv"):
     ok, msg = validate_tsv(tsv)
     if ok:
-        csv_tmp = tsv.with_suffix(".csv")
-        import pandas as pd
-        pd.read_csv(tsv, sep="\t").to_csv(csv_tmp, index=False)
-        if _copy_if_new(csv_tmp, finance_dir): promoted.append(csv_tmp.name)
-        csv_tmp.unlink()
+        # TSV → CSV in memory; no temp file in the landing zone
+        table = pacsv.read_csv(tsv, parse_options=pacsv.ParseOptions(delimiter="\t"))
+        buf = pa.BufferOutputStream()
+        pacsv.write_csv(table, buf)
+        csv_name = f"{tsv.stem}.csv"
+        if _write_if_new(buf.getvalue().to_pybytes(), csv_name, finance_dir): promoted.append(csv_name)
 
 print(f"✅ Promoted {len(promoted)} new files → RAW")
 
@@ -2,65 +2,92 @@
 # ─── Cell 1: Imports & Environment Setup ────────────────────────────────────────
 # Convert raw DistroKid HTML and TSV files into cleaned CSVs in the staging zone.
 # Uses PROJECT_ROOT for zone paths.
-import os, re, json
+import os, json, fnmatch
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from IPython.display import display
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+from common.utils.distrokid_patterns import STREAMS_RE, APPLE_RE, TRAILING_COMMA_RE
+from common.utils.file_helpers import place_file
+
 load_dotenv()
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT"))
 RAW      = PROJECT_ROOT / os.getenv("RAW_ZONE",     "raw")
 STAGING  = PROJECT_ROOT / os.getenv("STAGING_ZONE", "staging")
+json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # %%
 # ─── Cell 2: Locate Latest HTML & Helpers ───────────────────────────────────────
-raw_dir = RAW / "distrokid" / "streams"
-dk_html   = sorted(raw_dir.glob("streams_stats_*.html"), key=lambda p: p.stat().st_mtime, reverse=True)[0]
-apple_html= sorted(raw_dir.glob("applemusic_stats_*.html"), key=lambda p: p.stat().st_mtime, reverse=True)[0]
+def _latest(root: Path, pattern: str):
+    """Newest file in root matching pattern, in one scandir pass."""
+    best, best_mtime = None, -1.0
+    with os.scandir(root) as it:
+        for e in it:
+            if e.is_file() and fnmatch.fnmatch(e.name, pattern):
+                mtime = e.stat().st_mtime
+                if mtime > best_mtime:
+                    best, best_mtime = e, mtime
+    return Path(best.path) if best else None
 
-streams_re = re.compile(r'"id"\s*:\s*"trend365day".+?"dataProvider"\s*:\s*\[([^\]]+)\]', re.DOTALL)
-apple_re   = re.compile(r'"dataProvider"\s*:\s*\[([^\]]+)\]', re.DOTALL)
+raw_dir = RAW / "distrokid" / "streams"
+dk_html   = _latest(raw_dir, "streams_stats_*.html")
+apple_html= _latest(raw_dir, "applemusic_stats_*.html")
 
 
 # %%
 # ─── Cell 3: Extract Daily Streams from DistroKid HTML ──────────────────────────
-text = dk_html.read_text(encoding="utf-8", errors="ignore")
-arr   = "[" + streams_re.search(text).group(1) + "]"
-arr   = re.sub(r',\s*\]', ']', arr)
-dk_df = (pd.DataFrame(json.loads(arr))
-           .rename(columns={"category":"date","column-1":"spotify_streams"})
-           .assign(date=lambda d: pd.to_datetime(d["date"]),
-                   spotify_streams=lambda d: d["spotify_streams"].astype(int))
-           [["date","spotify_streams"]])
+text = dk_html.read_bytes()
+# Jump to the chart's "id" key instead of regex-scanning the whole page
+start = max(text.rfind(b'"id"', 0, text.find(b'"trend365day"')), 0)
+arr   = b"[" + STREAMS_RE.search(text, start).group(1) + b"]"
+arr   = TRAILING_COMMA_RE.sub(b']', arr)
+rows  = json_loads(arr)
+dk_df = pd.DataFrame({
+    "date":            pd.to_datetime([r["category"] for r in rows], format="ISO8601"),
+    "spotify_streams": np.fromiter((r["column-1"] for r in rows), dtype=np.int64, count=len(rows)),
+})
 
 
 # %%
 # ─── Cell 4: Extract Daily Streams from Apple Music HTML ────────────────────────
 providers = []
-for m in apple_re.finditer(apple_html.read_text(encoding="utf-8", errors="ignore")):
-    block = "[" + m.group(1) + "]"
-    block = re.sub(r',\s*\]', ']', block)
-    try: providers.append(json.loads(block))
+for m in APPLE_RE.finditer(apple_html.read_bytes()):
+    block = b"[" + m.group(1) + b"]"
+    block = TRAILING_COMMA_RE.sub(b']', block)
+    try: providers.append(json_loads(block))
     except: pass
 data = max(providers, key=len)
 date_key  = "field" if "field" in data[0] else "category"
 value_key = "value" if "value" in data[0] else ("column-1" if "column-1" in data[0] else list(data[0].keys())[1])
 
-apple_df = (pd.DataFrame(data)
-            .rename(columns={date_key:"date", value_key:"apple_streams"})
-            .assign(date=lambda d: pd.to_datetime(d["date"]),
-                    apple_streams=lambda d: d["apple_streams"].astype(int))
-            [["date","apple_streams"]])
+apple_df = pd.DataFrame({
+    "date":          pd.to_datetime([r[date_key] for r in data], format="ISO8601"),
+    "apple_streams": np.fromiter((r[value_key] for r in data), dtype=np.int64, count=len(data)),
+})
 
 
 # %%
 # ─── Cell 5: Merge, QC, Save to STAGING ─────────────────────────────────────────
-merged = (dk_df.merge(apple_df, on="date", how="outer")
-                .fillna(0)
-                .astype({"spotify_streams":"int64","apple_streams":"int64"}))
-merged["combined_streams"] = merged["spotify_streams"] + merged["apple_streams"]
+# Align both series on the union of their dates; int64 throughout, no NaN fill
+all_dates = np.union1d(dk_df["date"].values, apple_df["date"].values)
+spotify   = np.zeros(len(all_dates), dtype=np.int64)
+apple     = np.zeros(len(all_dates), dtype=np.int64)
+spotify[np.searchsorted(all_dates, dk_df["date"].values)]   = dk_df["spotify_streams"].values
+apple[np.searchsorted(all_dates, apple_df["date"].values)]  = apple_df["apple_streams"].values
+merged = pd.DataFrame({
+    "date":             all_dates,
+    "spotify_streams":  spotify,
+    "apple_streams":    apple,
+    "combined_streams": spotify + apple,
+})
 
 STAGING.mkdir(parents=True, exist_ok=True)
 out_csv = STAGING / "daily_streams_distrokid.csv"
@@ -72,10 +99,10 @@ print(f"💾 saved → {out_csv}")
 # %%
 # ─── Cell 6: Copy Bank Details CSV to STAGING ───────────────────────────────────
 finance_dir = RAW / "distrokid" / "finance"
-csvs = sorted(finance_dir.glob("dk_bank_details_*.csv"), key=lambda p: p.stat().st_mtime, reverse=True)
-if csvs:
+bank_src = _latest(finance_dir, "dk_bank_details_*.csv") if finance_dir.is_dir() else None
+if bank_src:
     bank_dst = STAGING / "dk_bank_details.csv"
-    bank_dst.write_bytes(csvs[0].read_bytes())
+    place_file(bank_src, bank_dst)                           # hard link, no byte copy
     print(f"💾 bank details copied → {bank_dst}")
 
 
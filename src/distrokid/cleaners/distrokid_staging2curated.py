@@ -2,11 +2,15 @@
 # ─── Cell 1: Imports & Environment Setup ────────────────────────────────────────
 # Merge daily DistroKid data into the curated dataset after validation.
 # Relies on PROJECT_ROOT for zone folders.
-import os, hashlib, datetime, shutil
+import io, os, datetime, shutil
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
+from common.utils.file_helpers import place_file
+from common.utils.hash_helpers import bytes_hash, file_hash
+
 load_dotenv()
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT"))
 STAGING = PROJECT_ROOT / os.getenv("STAGING_ZONE",  "staging")
@@ -16,40 +20,54 @@ ARCHIVE = PROJECT_ROOT / os.getenv("ARCHIVE_ZONE",  "archive")
 
 # %%
 # ─── Cell 2: Update tidy_daily_streams.csv without touching TooLost rows ────────
+# Curated output stays CSV (shared with toolost and downstream readers);
+# parse with Arrow's multithreaded reader instead of the Python engine
+def read_and_hash(p: Path):
+    """Load a CSV and hash its bytes from a single read."""
+    data = p.read_bytes()
+    return pd.read_csv(io.BytesIO(data), parse_dates=["date"], engine="pyarrow"), bytes_hash(data)
+
+order = pd.CategoricalDtype(categories=["distrokid","toolost"], ordered=True)
+
 dk_src = STAGING / "daily_streams_distrokid.csv"
-df_dk  = pd.read_csv(dk_src, parse_dates=["date"])
-df_dk["source"] = "distrokid"
-
-cur_path = CURATED / "tidy_daily_streams.csv"
-if cur_path.exists():
-    cur_df = pd.read_csv(cur_path, parse_dates=["date"])
-    cur_df = cur_df[cur_df["source"] != "distrokid"]        # remove stale DK rows
-    merged = pd.concat([cur_df, df_dk], ignore_index=True)
+df_dk  = pd.read_csv(dk_src, parse_dates=["date"], engine="pyarrow")
+# Build the categorical from codes (all "distrokid") rather than casting strings
+df_dk["source"] = pd.Categorical.from_codes(np.zeros(len(df_dk), dtype=np.int8), dtype=order)
+
+cur_path   = CURATED / "tidy_daily_streams.csv"
+cur_exists = cur_path.exists()
+cur_hash   = None
+if cur_exists:
+    cur_df, cur_hash = read_and_hash(cur_path)
+    # remove stale DK rows; matching categorical dtype lets concat keep it
+    cur_df = cur_df[cur_df["source"] != "distrokid"].astype({"source": order})
+    # DistroKid sorts first by source order, so concatenating the two
+    # individually sorted parts yields the (source, date) order directly
+    merged = pd.concat([df_dk.sort_values("date"), cur_df.sort_values(["source","date"])],
+                       ignore_index=True)
 else:
     cur_path.parent.mkdir(parents=True, exist_ok=True)
-    merged = df_dk
-
-num_cols = [c for c in merged.columns if c not in ("date","source")]
-merged[num_cols] = merged[num_cols].round().astype("int64")
+    merged = df_dk.sort_values("date", ignore_index=True)
 
-order = pd.CategoricalDtype(categories=["distrokid","toolost"], ordered=True)
-merged["source"] = merged["source"].astype(order)
-merged = merged.sort_values(["source","date"]).reset_index(drop=True)
+# Counts usually arrive as int64 already; only round/cast columns that don't
+num_cols = [c for c in merged.columns if c not in ("date","source") and merged[c].dtype != "int64"]
+if num_cols:
+    merged[num_cols] = merged[num_cols].round().astype("int64")
 
 
 # %%
 # ─── Cell 3: Save/Archive tidy_daily_streams.csv ────────────────────────────────
-def fhash(p: Path): return hashlib.md5(p.read_bytes()).hexdigest()
-def dfhash(df):     return hashlib.md5(df.to_csv(index=False).encode()).hexdigest()
+ts = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")   # shared by both archives
 
-if cur_path.exists() and fhash(cur_path) == dfhash(merged):
+# Serialise once: the same bytes are hashed for the change check and written
+csv_bytes = merged.to_csv(index=False).encode()
+if cur_exists and cur_hash == bytes_hash(csv_bytes):
     print("↩︎ No changes – curated already up-to-date.")
 else:
-    if cur_path.exists():
-        ts   = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    if cur_exists:
         ARCHIVE.mkdir(parents=True, exist_ok=True)
         shutil.copy2(cur_path, ARCHIVE / f"tidy_daily_streams_{ts}.csv")
-    merged.to_csv(cur_path, index=False)
+    cur_path.write_bytes(csv_bytes)
     print(f"✅ Curated updated → {cur_path.relative_to(PROJECT_ROOT)}")
 
 
@@ -59,13 +77,15 @@ bank_src = STAGING / "dk_bank_details.csv"
 bank_dst = CURATED / "dk_bank_details.csv"
 
 if bank_src.exists():
-    if bank_dst.exists() and fhash(bank_dst) == fhash(bank_src):
+    # Staging and curated are usually hard links of the same file by now
+    if bank_dst.exists() and (os.path.samefile(bank_dst, bank_src)
+                              or file_hash(bank_dst) == file_hash(bank_src)):
         print("↩︎ Bank details unchanged.")
     else:
         if bank_dst.exists():
-            ts = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
-            shutil.copy2(bank_dst, ARCHIVE / f"dk_bank_details_{ts}.csv")
-        shutil.copy2(bank_src, bank_dst)
+            ARCHIVE.mkdir(parents=True, exist_ok=True)
+            place_file(bank_dst, ARCHIVE / f"dk_bank_details_{ts}.csv")
+        place_file(bank_src, bank_dst)
         print(f"✅ Bank details promoted → {bank_dst.relative_to(PROJECT_ROOT)}")
 
 
@@ -2,11 +2,14 @@
 # Uses Playwright with credentials from environment variables.
 
 import os
+import re
+import asyncio
 import logging
 from pathlib import Path
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
-from src.common.cookies import load_cookies  # <-- unified cookie/session utility
+from src.common.cookies import load_cookies, load_cookies_async  # <-- unified cookie/session utility
 
 # Load environment variables from .env if present
 load_dotenv()
@@ -24,98 +27,101 @@ DEFAULT_SESSION_DIR = str(Path(PROJECT_ROOT) / "src" / ".playwright_dk_session")
 SESSION_DIR = os.getenv("PLAYWRIGHT_SESSION_DIR", DEFAULT_SESSION_DIR)
 LOGIN_URL = "https://distrokid.com/login"
 DASHBOARD_URL = "https://distrokid.com/stats/?data=streams"
+DASHBOARD_URL_RE = re.compile(r"/(dashboard|mymusic|stats)")
+BODY_SEL = 'body'
+EMAIL_SEL = 'input[type="email"]'
+DETAILS_SEL = 'a[href="/bank/details/"]'
+DOWNLOAD_SEL = 'div[onclick^="downloadBank"]'
 
 # Get credentials from environment variables
 DK_EMAIL = os.getenv("DK_EMAIL")
 DK_PASSWORD = os.getenv("DK_PASSWORD")
 
 
-def _launch_context(p):
-    browser = p.chromium.launch_persistent_context(SESSION_DIR, headless=False)
-    load_cookies(browser, "distrokid")
-    page = browser.new_page()
+async def _launch_context(p):
+    browser = await p.chromium.launch_persistent_context(SESSION_DIR, headless=False)
+    await load_cookies_async(browser, "distrokid")
+    page = await browser.new_page()
     return browser, page
 
 
-def _perform_login(page):
-    try:
-        page.wait_for_selector('input[type="email"]')
-        logging.info("Login form detected, filling credentials.")
-        page.fill('input[type="email"]', DK_EMAIL)
-        page.fill('input[type="password"]', DK_PASSWORD)
-        page.click('button[type="submit"]')
-        logging.info("Submitted login form. If 2FA is required, please complete it in the browser.")
-    except PlaywrightTimeoutError:
+async def _perform_login(page):
+    # goto() has already waited for the load event, so a single visibility
+    # query is enough; no timeout is spent on the already-authenticated path
+    if not await page.locator(EMAIL_SEL).is_visible():
         logging.info("Login form not detected. Assuming already authenticated.")
+        return
+    logging.info("Login form detected, filling credentials.")
+    await page.fill(EMAIL_SEL, DK_EMAIL)
+    await page.fill('input[type="password"]', DK_PASSWORD)
+    await page.click('button[type="submit"]')
+    logging.info("Submitted login form. If 2FA is required, please complete it in the browser.")
 
 
-def _wait_for_dashboard(page):
+async def _wait_for_dashboard(page):
     print("Please complete the DistroKid login and 2FA in the browser window.")
     print("Once you are on your dashboard, the script will automatically download stats pages.")
-    import time
-    while True:
-        if any(x in page.url for x in ["/dashboard", "/mymusic", "/stats"]):
-            logging.info(f"Dashboard detected at {page.url}. Proceeding to download stats.")
-            break
-        time.sleep(2)
-
-
-def _download_stats(page, output_dir: str, dt_str: str):
-    stats_url = "https://distrokid.com/stats/?type=all&data=streams"
-    logging.info(f"Navigating to streams stats page: {stats_url}")
-    page.goto(stats_url)
-    page.wait_for_selector('body')
-    html = page.content()
-    streams_file = os.path.join(output_dir, f'streams_stats_{dt_str}.html')
-    with open(streams_file, 'w', encoding='utf-8') as f:
-        f.write(html)
-    logging.info(f"Streams stats page HTML saved to {streams_file}")
-
-    am_url = "https://distrokid.com/stats/?type=all&data=applemusic"
-    logging.info(f"Navigating to Apple Music stats page: {am_url}")
-    page.goto(am_url)
-    page.wait_for_selector('body')
-    am_html = page.content()
-    am_file = os.path.join(output_dir, f'applemusic_stats_{dt_str}.html')
-    with open(am_file, 'w', encoding='utf-8') as f:
-        f.write(am_html)
-    logging.info(f"Apple Music stats page HTML saved to {am_file}")
+    # Event-driven: returns on the navigation itself instead of polling page.url;
+    # no timeout because 2FA is completed by hand
+    await page.wait_for_url(DASHBOARD_URL_RE, timeout=0)
+    logging.info(f"Dashboard detected at {page.url}. Proceeding to download stats.")
+
+
+async def _fetch_html(page, url: str, out_file: str, label: str):
+    logging.info(f"Navigating to {label} stats page: {url}")
+    # Save the document response bytes as served: no DOM serialisation and no
+    # str decode/encode round trip for multi-MB pages
+    resp = await page.goto(url)
+    await page.locator(BODY_SEL).wait_for(state='visible')
+    if resp is not None:
+        Path(out_file).write_bytes(await resp.body())
+    else:
+        Path(out_file).write_text(await page.content(), encoding='utf-8')
+    logging.info(f"{label} stats page HTML saved to {out_file}")
 
+
+async def _download_bank(page, output_dir: str, dt_str: str):
     try:
-        page.goto("https://distrokid.com/bank/")
-        page.wait_for_selector('a[href="/bank/details/"]')
-        page.click('a[href="/bank/details/"]')
-        page.wait_for_url("https://distrokid.com/bank/details/")
-        page.wait_for_selector('div[onclick^="downloadBank"]')
+        await page.goto("https://distrokid.com/bank/")
+        # Locator clicks auto-wait for the element, so no separate wait_for_selector
+        await page.locator(DETAILS_SEL).click()
+        await page.wait_for_url("https://distrokid.com/bank/details/")
         tsv_file = os.path.join(output_dir, f'dk_bank_details_{dt_str}.tsv')
-        with page.expect_download() as download_info:
-            page.click('div[onclick^="downloadBank"]')
-        download = download_info.value
-        download.save_as(tsv_file)
+        async with page.expect_download() as download_info:
+            await page.locator(DOWNLOAD_SEL).click()
+        download = await download_info.value
+        await download.save_as(tsv_file)
         logging.info(f"DistroKid bank TSV downloaded to {tsv_file}")
     except Exception as exc:
         logging.error(f"Failed to download DistroKid bank TSV: {exc}")
 
 
-def login_distrokid():
-    """
-    /// Automates login to DistroKid, including 2FA, and persists session for
-    /// future use. Credentials are read from environment variables DK_EMAIL and
-    /// DK_PASSWORD. If 2FA is required, the user will be prompted to enter the
-    /// code manually in the browser.
-    """
-    if not DK_EMAIL or not DK_PASSWORD:
-        logging.error("DK_EMAIL and DK_PASSWORD must be set in environment variables or .env file.")
-        return False
-
-    with sync_playwright() as p:
+async def _download_stats(browser, page, output_dir: str, dt_str: str):
+    # The three downloads are independent, so drive them in parallel tabs of the
+    # same (already authenticated) context: wall time is the slowest page, not the sum
+    am_page, bank_page = await browser.new_page(), await browser.new_page()
+    try:
+        await asyncio.gather(
+            _fetch_html(page, "https://distrokid.com/stats/?type=all&data=streams",
+                        os.path.join(output_dir, f'streams_stats_{dt_str}.html'), "Streams"),
+            _fetch_html(am_page, "https://distrokid.com/stats/?type=all&data=applemusic",
+                        os.path.join(output_dir, f'applemusic_stats_{dt_str}.html'), "Apple Music"),
+            _download_bank(bank_page, output_dir, dt_str),
+        )
+    finally:
+        await am_page.close()
+        await bank_page.close()
+
+
+async def _login_distrokid():
+    async with async_playwright() as p:
         try:
-            browser, page = _launch_context(p)
-            page.goto(LOGIN_URL)
+            browser, page = await _launch_context(p)
+            await page.goto(LOGIN_URL)
             logging.info(f"Navigated to {LOGIN_URL}")
 
-            _perform_login(page)
-            _wait_for_dashboard(page)
+            await _perform_login(page)
+            await _wait_for_dashboard(page)
 
             from datetime import datetime
             output_dir = os.path.abspath(
@@ -123,11 +129,11 @@ def login_distrokid():
             )
             os.makedirs(output_dir, exist_ok=True)
             dt_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            _download_stats(page, output_dir, dt_str)
+            await _download_stats(browser, page, output_dir, dt_str)
 
             print("Saving updated cookies...")
             # Save updated cookies
-            cookies = browser.cookies()
+            cookies = await browser.cookies()
             import json
             cookie_dir = Path(PROJECT_ROOT) / "src" / "distrokid" / "cookies"
             cookie_dir.mkdir(parents=True, exist_ok=True)
@@ -155,13 +161,25 @@ def login_distrokid():
                 logging.warning("No DistroKid cookies found to save.")
 
             print("All downloads complete. Closing browser...")
-            browser.close()
+            await browser.close()
             logging.info("Browser closed automatically after successful data capture.")
             return True
         except Exception as e:
             logging.exception(f"An unexpected error occurred: {e}")
             return False
 
+def login_distrokid():
+    """
+    /// Automates login to DistroKid, including 2FA, and persists session for
+    /// future use. Credentials are read from environment variables DK_EMAIL and
+    /// DK_PASSWORD. If 2FA is required, the user will be prompted to enter the
+    /// code manually in the browser.
+    """
+    if not DK_EMAIL or not DK_PASSWORD:
+        logging.error("DK_EMAIL and DK_PASSWORD must be set in environment variables or .env file.")
+        return False
+    return asyncio.run(_login_distrokid())
+
 def test_login_distrokid():
     """
     /// Test to verify if the login session is valid and can access the stats
@@ -177,7 +195,7 @@ def test_login_distrokid():
             load_cookies(browser, "distrokid")
             page = browser.new_page()
             page.goto(DASHBOARD_URL)
-            page.wait_for_selector('body')
+            page.locator(BODY_SEL).wait_for(state='visible')
             if "login" in page.url:
                 logging.warning("Session is not valid, redirected to login page.")
                 result = False
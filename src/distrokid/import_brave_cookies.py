@@ -6,7 +6,12 @@ import json
 import browser_cookie3
 from pathlib import Path
 import os
-from datetime import datetime
+import shutil
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
 def import_distrokid_cookies():
     """Import DistroKid cookies from Brave browser"""
@@ -45,20 +50,31 @@ def import_distrokid_cookies():
         
         cookies_file = cookies_dir / 'distrokid_cookies.json'
         
-        # Backup existing cookies
+        # Write a sibling temp file, then swap it in with one atomic rename so the
+        # cookies file is never missing or half-written. The previous generation is
+        # kept as a single fixed-name backup (hard link, so no copy either).
+        tmp_file = cookies_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(cookies, indent=2).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
         if cookies_file.exists():
-            backup_file = cookies_dir / f'distrokid_cookies_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            backup_file = cookies_file.with_suffix('.json.bak')   # not picked up by the *.json loader
             print(f"Backing up existing cookies to {backup_file.name}")
-            cookies_file.rename(backup_file)
-        
-        # Save new cookies
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
+            backup_file.unlink(missing_ok=True)
+            try:
+                os.link(cookies_file, backup_file)
+            except OSError:
+                shutil.copy2(cookies_file, backup_file)
+        os.replace(tmp_file, cookies_file)
         
         print(f"Successfully imported {len(cookies)} cookies to {cookies_file}")
         print("\nCookie names imported:")
-        for cookie in cookies:
-            print(f"  - {cookie['name']}")
+        print("\n".join(f"  - {c['name']}" for c in cookies))
         
         return True
         
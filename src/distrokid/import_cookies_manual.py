@@ -4,8 +4,9 @@ Manual cookie import for DistroKid
 Since we're in WSL, we'll need to manually export cookies from Brave
 """
 import json
+import os
+import shutil
 from pathlib import Path
-from datetime import datetime
 import sys
 
 def convert_brave_export_to_playwright(brave_cookies_json):
@@ -60,20 +61,28 @@ def convert_brave_export_to_playwright(brave_cookies_json):
     
     cookies_file = cookies_dir / 'distrokid_cookies.json'
     
-    # Backup existing cookies
+    # Write a sibling temp file, then swap it in with one atomic rename so the
+    # cookies file is never missing or half-written. The previous generation is
+    # kept as a single fixed-name backup (hard link, so no copy either).
+    tmp_file = cookies_file.with_suffix('.json.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(playwright_cookies, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+
     if cookies_file.exists():
-        backup_file = cookies_dir / f'distrokid_cookies_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        backup_file = cookies_file.with_suffix('.json.bak')   # not picked up by the *.json loader
         print(f"Backing up existing cookies to {backup_file.name}")
-        cookies_file.rename(backup_file)
-    
-    # Save new cookies
-    with open(cookies_file, 'w') as f:
-        json.dump(playwright_cookies, f, indent=2)
+        backup_file.unlink(missing_ok=True)
+        try:
+            os.link(cookies_file, backup_file)
+        except OSError:
+            shutil.copy2(cookies_file, backup_file)
+    os.replace(tmp_file, cookies_file)
     
     print(f"Successfully converted {len(playwright_cookies)} cookies to {cookies_file}")
     print("\nCookie names imported:")
-    for cookie in playwright_cookies:
-        print(f"  - {cookie['name']}")
+    print("\n".join(f"  - {c['name']}" for c in playwright_cookies))
     
     return True
 
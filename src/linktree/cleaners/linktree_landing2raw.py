@@ -5,10 +5,16 @@
 /// Guided by `LLM_cleaner_guidelines.md`.
 """
 
-import os, json, argparse
+import os, json, glob, argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 PLATFORM = "linktree"
 PROJECT_ROOT = Path(os.environ["PROJECT_ROOT"])
 
@@ -22,16 +28,29 @@ RAW_DIR     = PROJECT_ROOT / RAW_ZONE / PLATFORM
 for _dir in (LANDING_DIR, RAW_DIR):
     _dir.mkdir(parents=True, exist_ok=True)
 
+# bytes in, bytes out (UTF-8, never any embedded newline) for either backend
+if orjson is not None:
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+else:
+    json_loads = json.loads
+    json_dumps = lambda obj: json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# Path to the analytics rows in the usual GraphQL response, resolved once
+TIMESERIES_PATH = ("data", "getAccountAnalytics", "overview", "timeseries")
+
+def _dig(obj, path):
+    """Follow *path* through nested dicts; None on any miss (no exceptions)."""
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
 def transform_response(payload: dict) -> list[dict]:
     """Flatten GraphQL responses - handle multiple possible structures."""
     # Try main structure first
-    try:
-        ts_rows = (
-            payload["data"]
-                   ["getAccountAnalytics"]
-                   ["overview"]
-                   ["timeseries"]
-        )
+    ts_rows = _dig(payload, TIMESERIES_PATH)
+    if isinstance(ts_rows, list):
         print(f"[DEBUG] Found timeseries data with {len(ts_rows)} rows")
         return [{
             "date":              r.get("date"),
@@ -42,11 +61,9 @@ def transform_response(payload: dict) -> list[dict]:
             "clickThroughRate":  r.get("clickThroughRate"),
             "__typename":        r.get("__typename")
         } for r in ts_rows]
-    except (KeyError, TypeError) as e:
-        pass
-    
+
     # Try alternative structures or extract any data arrays found
-    if "data" in payload:
+    if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
         data = payload["data"]
         # Look for any arrays that might contain analytics data
         for key, value in data.items():
@@ -66,24 +83,22 @@ def transform_response(payload: dict) -> list[dict]:
     # Store the entire payload for analysis if no structure matches
     return [{"raw_payload": payload, "needs_analysis": True}]
 
-def process_file(in_path: Path) -> int:
+def process_file(in_path: str | Path) -> int:
+    in_path = Path(in_path)
     # Ensure analytics subdirectory exists in raw
     analytics_dir = RAW_DIR / "analytics"
     analytics_dir.mkdir(parents=True, exist_ok=True)
     out_path = analytics_dir / f"{in_path.stem}.ndjson"
     written  = 0
     try:
-        with in_path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = json_loads(in_path.read_bytes())
         rows = transform_response(payload)
         if not rows:
             print(f"[WARN] No data extracted from {in_path.name}")
             return 0
-        with out_path.open("w", encoding="utf-8") as out_f:
-            for row in rows:
-                json.dump(row, out_f, ensure_ascii=False)
-                out_f.write("\n")
-                written += 1
+        # One buffer, one write for the whole NDJSON file
+        out_path.write_bytes(b"\n".join(json_dumps(row) for row in rows) + b"\n")
+        written = len(rows)
         print(f"[RAW]  {in_path.name} → {out_path.name} ({written} rows)")
         return written
     except Exception as e:
@@ -100,12 +115,19 @@ def main():
     files = (
         [Path(args.file)]
         if args.file else
-        sorted((LANDING_DIR / "analytics").glob("*.json"))
+        # Plain strings: no Path per entry, and cheaper to hand to the pool
+        sorted(glob.iglob(os.path.join(glob.escape(str(LANDING_DIR / "analytics")), "*.json")))
     )
 
-    total_rows = 0
-    for fp in files:
-        total_rows += process_file(fp)
+    # Files are independent JSON → NDJSON conversions: spread them over cores
+    # (a single file is not worth the worker start-up)
+    if len(files) > 1:
+        workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            total_rows = sum(ex.map(process_file, files,
+                                    chunksize=max(1, len(files) // (workers * 4))))
+    else:
+        total_rows = sum(process_file(fp) for fp in files)
 
     if total_rows == 0:
         print("[WARN] No records processed - this may indicate a structure change in GraphQL responses.")
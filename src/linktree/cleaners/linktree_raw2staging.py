@@ -13,11 +13,20 @@
 """
 
 import os
+import glob
 import json
 import argparse
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as paj
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
 PLATFORM = "linktree"
 PROJECT_ROOT = Path(os.environ["PROJECT_ROOT"])
@@ -39,19 +48,28 @@ METRIC_COLS = [
     "uniqueClicks",
     "clickThroughRate",
 ]
+json_loads = orjson.loads if orjson is not None else json.loads
+JSON_ERRORS = (ValueError,)  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
+
+# Flattened landing2raw rows, parsed by Arrow in C; counts stay int64 unless
+# something is missing, as pd.to_numeric would infer
+FLAT_SCHEMA = pa.schema(
+    [("date", pa.string())]
+    + [(c, pa.int64()) for c in METRIC_COLS if c != "clickThroughRate"]
+    + [("clickThroughRate", pa.float64())]
+)
+FLAT_PARSE_OPTIONS = paj.ParseOptions(explicit_schema=FLAT_SCHEMA,
+                                      unexpected_field_behavior="ignore")
 
 
-def record_to_row(rec: dict) -> dict | None:
+def coerce_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
-    /// Validate & convert a single JSON record.
-    /// Returns a dict or None (when 'date' is missing).
+    /// Validate & convert all extracted records at once.
+    /// Unparseable dates / metrics become NaT / NaN.
     """
-    if "date" not in rec:
-        return None
-    row = {"date": pd.to_datetime(rec["date"], errors="coerce")}
-    for col in METRIC_COLS:
-        row[col] = pd.to_numeric(rec.get(col), errors="coerce")
-    return row
+    df["date"] = pd.to_datetime(df["date"], errors="coerce", format="ISO8601")
+    df[METRIC_COLS] = df[METRIC_COLS].apply(pd.to_numeric, errors="coerce")
+    return df
 
 
 def extract_timeseries_rows(obj: dict) -> list[dict]:
@@ -69,12 +87,13 @@ def extract_timeseries_rows(obj: dict) -> list[dict]:
     if "date" in obj:
         return [obj]
 
-    # Case 2 – nested payload
-    try:
-        ts_rows = (
-            obj["data"]["getAccountAnalytics"]["overview"]["timeseries"]
-        )
-    except (KeyError, TypeError):
+    # Case 2 – nested payload (plain lookups, no exception on a miss)
+    ts_rows = obj
+    for key in ("data", "getAccountAnalytics", "overview", "timeseries"):
+        if not isinstance(ts_rows, dict):
+            return []
+        ts_rows = ts_rows.get(key)
+    if not isinstance(ts_rows, list):
         return []
 
     return [
@@ -90,27 +109,54 @@ def extract_timeseries_rows(obj: dict) -> list[dict]:
     ]
 
 
-def build_dataframe(files: list[Path]) -> pd.DataFrame:
+def read_flat_ndjson(data: bytes) -> pd.DataFrame | None:
+    """
+    /// Arrow fast path for files holding only flattened rows.
+    /// Returns None when the file needs the per-line reader (nested GraphQL
+    /// payloads, malformed lines or off-schema values).
+    """
+    if b'"getAccountAnalytics"' in data:
+        return None
+    try:
+        table = paj.read_json(pa.BufferReader(data), parse_options=FLAT_PARSE_OPTIONS)
+    except pa.ArrowInvalid:
+        return None
+    # Lines without a date (e.g. raw_data captures) are not rows
+    return table.filter(pc.is_valid(table["date"])).to_pandas()
+
+
+def read_ndjson_lines(data: bytes) -> pd.DataFrame:
+    """Per-line fallback reader handling every layout extract_timeseries_rows knows."""
     rows: list[dict] = []
+    for line in data.splitlines():
+        try:
+            obj = json_loads(line)
+        except JSON_ERRORS:
+            continue
+        if isinstance(obj, dict) and "date" in obj:
+            rows.append(obj)      # already flattened by landing2raw
+        else:
+            rows.extend(extract_timeseries_rows(obj))
+    return pd.DataFrame(rows, columns=["date", *METRIC_COLS])
+
+
+def build_dataframe(files: list[str | Path]) -> pd.DataFrame:
+    frames: list[pd.DataFrame] = []
     for fp in files:
         try:
-            with fp.open("r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    for row in extract_timeseries_rows(obj):
-                        rows.append(record_to_row(row))
+            with open(fp, "rb") as f:
+                data = f.read()
+            df_part = read_flat_ndjson(data)
+            frames.append(df_part if df_part is not None else read_ndjson_lines(data))
         except Exception as e:
-            print(f"[ERROR] {fp.name}: {e}")
-
-    rows = [r for r in rows if r]  # drop Nones
+            print(f"[ERROR] {os.path.basename(fp)}: {e}")
 
-    if not rows:
+    frames = [f for f in frames if len(f)]
+    if not frames:
         raise RuntimeError("No valid rows extracted from raw NDJSON files")
 
-    df = pd.DataFrame(rows)
+    # Type conversion happens column-wise, once, over all files
+    df = coerce_columns(pd.concat(frames, ignore_index=True))
     df = df.dropna(subset=["date"])  # ensure date is present
     df = df.sort_values("date").drop_duplicates()
     df.reset_index(drop=True, inplace=True)
@@ -122,7 +168,7 @@ def main() -> None:
     parser.add_argument("--out", help="Custom CSV output path", default=None)
     args = parser.parse_args()
 
-    files = sorted(RAW_DIR.glob("*.ndjson"))
+    files = sorted(glob.iglob(os.path.join(glob.escape(str(RAW_DIR)), "*.ndjson")))
     if not files:
         raise RuntimeError(f"No NDJSON files found in {RAW_DIR}")
 
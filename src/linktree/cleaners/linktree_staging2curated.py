@@ -3,14 +3,19 @@
 /// Staging → Curated cleaner for Linktree analytics.
 ///
 /// Guided by `LLM_cleaner_guidelines.md`.
-/// Reads **CSV** from staging, writes **CSV and Parquet** to curated.
+/// Reads **CSV** from staging, writes **CSV and/or Parquet** to curated
+/// (``--formats``, CSV only by default).
 """
 
-import os, argparse
+import os, glob, errno, argparse
 from shutil import move
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 
 PLATFORM      = "linktree"
 PROJECT_ROOT  = Path(os.environ["PROJECT_ROOT"])
@@ -26,32 +31,66 @@ CURATED_DIR   = PROJECT_ROOT / CURATED_ZONE
 for _d in (STAGING_DIR, CURATED_DIR):
     _d.mkdir(parents=True, exist_ok=True)
 
+COUNT_COLS = ["totalViews", "uniqueViews", "totalClicks", "uniqueClicks"]
+
+# Fixed scan schema: files missing a column read it as null, extra columns
+# (e.g. __typename in older staging files) are not read at all
+STAGING_SCHEMA = pa.schema(
+    [("date", pa.timestamp("s"))]
+    + [(c, pa.float64()) for c in COUNT_COLS + ["clickThroughRate"]]
+)
+
 def curate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if "__typename" in df.columns:
         df = df.drop(columns="__typename")
 
     # Re-calculate CTR if missing / NaN
-    # Convert inf values to NaN manually instead of using deprecated option
-    ctr = df["totalClicks"] / df["totalViews"].replace({0: pd.NA})
-    ctr = ctr.replace([float('inf'), float('-inf')], pd.NA)
-    df["clickThroughRate"] = df["clickThroughRate"].fillna(ctr)
-    df["clickThroughRate"] = df["clickThroughRate"].round(4)
+    # One masked float64 divide: zero/missing views give NaN, never inf, and
+    # nothing is promoted to object dtype by pd.NA
+    tv  = df["totalViews"].to_numpy(dtype="float64", na_value=np.nan)
+    tc  = df["totalClicks"].to_numpy(dtype="float64", na_value=np.nan)
+    ctr = np.divide(tc, tv, out=np.full_like(tc, np.nan), where=tv > 0)
+    # An all-empty CTR column can arrive untyped, so coerce before filling
+    df["clickThroughRate"] = (pd.to_numeric(df["clickThroughRate"], errors="coerce")
+                                .fillna(pd.Series(ctr, index=df.index))
+                                .round(4))
 
-    # Keep last record per date
+    # Keep last record per date (in file order), then sort only the survivors
     df = (
-        df.sort_values("date")
-          .drop_duplicates(subset=["date"], keep="last")
+        df.drop_duplicates(subset=["date"], keep="last")
+          .sort_values("date")
           .reset_index(drop=True)
     )
     return df
 
-def load_staging(files: list[Path]) -> pd.DataFrame:
+def load_staging(files: list[str | Path]) -> pd.DataFrame:
+    """
+    /// Read all staging CSVs as one Arrow dataset scan (parallel parse, one
+    /// table, no per-file frames + concat). Falls back to per-file reads if
+    /// any file cannot be scanned, so one bad file only drops itself.
+    """
+    fmt = ds.CsvFileFormat(convert_options=pacsv.ConvertOptions(column_types=STAGING_SCHEMA))
+    try:
+        table = ds.dataset([str(fp) for fp in files], schema=STAGING_SCHEMA, format=fmt).to_table()
+    except (pa.ArrowInvalid, OSError) as e:
+        print(f"[WARN] Dataset scan failed ({e}); reading files one by one")
+        return _load_staging_per_file(files)
+    df = table.to_pandas()
+    # Counts are whole numbers: keep int64 wherever nothing is missing, as
+    # per-file type inference would
+    for c in COUNT_COLS:
+        if df[c].notna().all() and (df[c] % 1 == 0).all():
+            df[c] = df[c].astype("int64")
+    return df
+
+def _load_staging_per_file(files: list[str | Path]) -> pd.DataFrame:
     frames = []
     for fp in files:
         try:
-            frames.append(pd.read_csv(fp, parse_dates=["date"]))
+            # Arrow's multithreaded C++ parser instead of the default engine
+            frames.append(pd.read_csv(fp, parse_dates=["date"], engine="pyarrow"))
         except Exception as e:
-            print(f"[ERROR] {fp.name}: {e}")
+            print(f"[ERROR] {os.path.basename(fp)}: {e}")
     if not frames:
         raise RuntimeError("No staging CSV files read")
     return pd.concat(frames, ignore_index=True)
@@ -59,9 +98,16 @@ def load_staging(files: list[Path]) -> pd.DataFrame:
 def main():
     parser = argparse.ArgumentParser(description="Linktree Staging→Curated cleaner")
     parser.add_argument("--input", help="Specific staging CSV file", default=None)
+    parser.add_argument(
+        "--formats", default="csv",
+        help="Comma-separated curated outputs: csv, parquet (default: csv)",
+    )
     args = parser.parse_args()
+    formats = {f.strip().lower() for f in args.formats.split(",") if f.strip()}
+    if not formats <= {"csv", "parquet"}:
+        parser.error(f"unknown --formats value(s): {', '.join(sorted(formats - {'csv', 'parquet'}))}")
 
-    files = [Path(args.input)] if args.input else sorted(STAGING_DIR.glob("*.csv"))
+    files = [Path(args.input)] if args.input else sorted(glob.iglob(os.path.join(glob.escape(str(STAGING_DIR)), "*.csv")))
     if not files:
         raise RuntimeError(f"No staging CSV files found in {STAGING_DIR}")
 
@@ -73,16 +119,32 @@ def main():
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
     
     existing_file = CURATED_DIR / "linktree_analytics.csv"
-    if existing_file.exists():
+    if "csv" in formats and existing_file.exists():
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         archive_name = f"linktree_analytics_archived_{ts}.csv"
-        move(str(existing_file), ARCHIVE_DIR / archive_name)
+        try:
+            os.replace(existing_file, ARCHIVE_DIR / archive_name)   # same volume: one rename(2)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            move(str(existing_file), ARCHIVE_DIR / archive_name)  # cross-device copy + unlink
         print(f"[ARCHIVE] Moved existing file to {ARCHIVE_DIR.relative_to(PROJECT_ROOT)}/{archive_name}")
 
     # Write new CSV with fixed name
-    csv_path = CURATED_DIR / "linktree_analytics.csv"
-    df_cur.to_csv(csv_path, index=False, encoding="utf-8")
-    print(f"[CURATED] CSV → {csv_path.name}  ({len(df_cur)} rows)")
+    if "csv" in formats:
+        csv_path = CURATED_DIR / "linktree_analytics.csv"
+        df_cur.to_csv(csv_path, index=False, encoding="utf-8")
+        print(f"[CURATED] CSV → {csv_path.name}  ({len(df_cur)} rows)")
+
+    # Small daily table: zstd and a single row group beat the snappy defaults
+    if "parquet" in formats:
+        pq_path = CURATED_DIR / "linktree_analytics.parquet"
+        df_cur.to_parquet(
+            pq_path, index=False, engine="pyarrow",
+            compression="zstd", compression_level=3,
+            row_group_size=max(len(df_cur), 1),
+        )
+        print(f"[CURATED] Parquet → {pq_path.name}  ({len(df_cur)} rows)")
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,8 @@ import pytest
 
 # Ensure src/ is on the path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Cleaners import shared helpers as top-level ``common``
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'src'))
 
 @pytest.fixture
 def sample_dataframe():
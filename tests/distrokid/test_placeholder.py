@@ -44,3 +44,49 @@ def test_copy_if_new(tmp_path):
     assert dlr._copy_if_new(src, dest_dir) is True
     assert len(list(dest_dir.glob('file*.txt'))) == 2
 
+
+def test_copy_if_new_compares_size_then_hash(tmp_path):
+    dlr = get_module(tmp_path)
+    src = tmp_path / 'file.txt'
+    dest_dir = tmp_path / 'dest'
+    dest_dir.mkdir()
+    src.write_text('aaaa')
+    assert dlr._copy_if_new(src, dest_dir) is True
+    # Same bytes, different mtime: hashed and recognised as unchanged
+    os.utime(src, (0, 0))
+    assert dlr._copy_if_new(src, dest_dir) is False
+    # Same size, different bytes: hashed and promoted as a new version
+    src.write_text('bbbb')
+    assert dlr._copy_if_new(src, dest_dir) is True
+    assert len(list(dest_dir.glob('file*.txt'))) == 2
+
+
+def test_copy_if_new_keeps_mtime(tmp_path):
+    dlr = get_module(tmp_path)
+    src = tmp_path / 'file.txt'
+    dest_dir = tmp_path / 'dest'
+    dest_dir.mkdir()
+    src.write_text('hello' * 1000)
+    os.utime(src, (1_000_000, 1_000_000))
+    assert dlr._copy_if_new(src, dest_dir) is True
+    dst = dest_dir / src.name
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_write_if_new(tmp_path):
+    dlr = get_module(tmp_path)
+    dest_dir = tmp_path / 'dest'
+    dest_dir.mkdir()
+    assert dlr._write_if_new(b'a,b\n1,2\n', 'bank.csv', dest_dir) is True
+    assert dlr._write_if_new(b'a,b\n1,2\n', 'bank.csv', dest_dir) is False
+    assert dlr._write_if_new(b'a,b\n1,3\n', 'bank.csv', dest_dir) is True
+    assert len(list(dest_dir.glob('bank*.csv'))) == 2
+
+
+def test_validate_html_rejects_pages_without_marker(tmp_path):
+    dlr = get_module(tmp_path)
+    f = tmp_path / 'streams_stats_20250101.html'
+    f.write_text('"dataProvider": [] var x = 1;\n')
+    assert dlr.validate_streams_html(f) == (False, "trend365day block missing")
+    assert dlr.validate_apple_html(f) == (False, "chartData block missing")
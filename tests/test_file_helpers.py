@@ -0,0 +1,24 @@
+import os
+
+
+def test_place_file_links_and_replaces(tmp_path, monkeypatch):
+    from src.common.utils import file_helpers as mod
+    src = tmp_path / 'a.csv'
+    dst = tmp_path / 'b.csv'
+    src.write_text('x,y\n1,2\n')
+    dst.write_text('stale')
+    snapshot = tmp_path / 'snap.csv'
+    mod.place_file(dst, snapshot)
+
+    mod.place_file(src, dst)
+    assert dst.read_text() == src.read_text()
+    assert os.path.samefile(src, dst)
+    assert snapshot.read_text() == 'stale'      # old inode left untouched
+
+    # Falls back to a real copy when hard links are unavailable
+    def refuse(*_):
+        raise OSError('no links')
+    monkeypatch.setattr(mod.os, 'link', refuse)
+    mod.place_file(src, snapshot)
+    assert snapshot.read_text() == src.read_text()
+    assert not os.path.samefile(src, snapshot)
@@ -0,0 +1,15 @@
+import hashlib
+
+
+def test_file_hash_chunked(tmp_path, monkeypatch):
+    from src.common.utils import hash_helpers as mod
+    f = tmp_path / 'data.bin'
+    data = bytes(range(256)) * 10
+    f.write_bytes(data)
+    expected = hashlib.new(mod.HASH_ALGORITHM, data).hexdigest()
+    assert mod.file_hash(f) == expected
+    assert mod.bytes_hash(data) == expected
+    # Exercise the readinto fallback used before Python 3.11
+    monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+    monkeypatch.setattr(mod, '_CHUNK_SIZE', 100)
+    assert mod.file_hash(f) == expected
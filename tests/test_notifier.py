@@ -0,0 +1,66 @@
+from src.common.cookie_refresh import notifier as mod
+
+
+class FakeSMTP:
+    sessions = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        FakeSMTP.sessions.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        self.sent.append(msg['Subject'])
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_email_send_batch_uses_one_session(monkeypatch):
+    monkeypatch.setattr(mod.smtplib, 'SMTP', FakeSMTP)
+    FakeSMTP.sessions = []
+    channel = mod.EmailNotificationChannel({
+        'smtp_host': 'localhost', 'from_email': 'a@example.com', 'to_emails': ['b@example.com'],
+    })
+    events = [
+        mod.NotificationEvent('spotify', mod.NotificationLevel.WARNING, 'stale'),
+        mod.NotificationEvent('tiktok', mod.NotificationLevel.CRITICAL, 'expired'),
+    ]
+    assert channel.send_batch(events) == 2
+    assert len(FakeSMTP.sessions) == 1
+    assert len(FakeSMTP.sessions[0].sent) == 2
+
+
+def test_notifier_send_batch_records_history():
+    notifier = mod.CookieRefreshNotifier({'console': {'enabled': False}})
+    batches = []
+
+    class RecordingChannel(mod.NotificationChannel):
+        def send(self, event):
+            return True
+
+        def send_batch(self, events):
+            batches.append([e.message for e in events])
+            return len(events)
+
+        def is_available(self):
+            return True
+
+    notifier.channels = [RecordingChannel()]
+    notifier.send_batch([
+        {'level': mod.NotificationLevel.CRITICAL, 'message': 'down', 'service': 'HEALTH_MONITOR'},
+        {'level': mod.NotificationLevel.ERROR, 'message': 'failed'},
+    ])
+    assert batches == [['down', 'failed']]
+    assert [e.service for e in notifier.get_notification_history()] == ['HEALTH_MONITOR', 'SYSTEM']
@@ -0,0 +1,186 @@
+import os
+
+
+def get_monitor(tmp_path, **kwargs):
+    os.environ['PROJECT_ROOT'] = str(tmp_path)
+    from src.common import pipeline_health_monitor as mod
+    monitor = mod.PipelineHealthMonitor(enable_auto_remediation=False, **kwargs)
+    monitor.project_root = tmp_path
+    return mod, monitor
+
+
+def test_generate_report_served_from_cache(tmp_path):
+    mod, monitor = get_monitor(tmp_path)
+    first = monitor.generate_report()
+    assert monitor.generate_report() is first
+    assert monitor.generate_report(force=True) is not first
+
+
+def test_generate_report_cache_disabled(tmp_path):
+    mod, monitor = get_monitor(tmp_path, cache_ttl_s=0)
+    first = monitor.generate_report()
+    assert monitor.generate_report() is not first
+
+
+def test_dump_report_json_round_trips(tmp_path):
+    import json
+    mod, monitor = get_monitor(tmp_path)
+    report = monitor.generate_report()
+    assert '_urgent_actions' in report and '_normal_actions' in report
+    public = {k: v for k, v in report.items() if not k.startswith('_')}
+    assert json.loads(mod.dump_report_json(report)) == public
+
+
+def test_auto_remediation_dedupes_and_skips_after_failed_refresh(tmp_path):
+    mod, monitor = get_monitor(tmp_path)
+    calls = []
+
+    class FailingRefresher:
+        def refresh_service(self, service):
+            calls.append(('refresh', service))
+            return {'success': False, 'error': 'login required'}
+
+    monitor.cookie_manager = FailingRefresher()
+    monitor._run_cleaners = lambda service: calls.append(('clean', service)) or True
+    actions = [
+        {'type': 'run_cleaners', 'service': 'spotify', 'reason': 'x', 'priority': 'medium'},
+        {'type': 'cookie_refresh', 'service': 'spotify', 'reason': 'x', 'priority': 'medium'},
+        {'type': 'cookie_refresh', 'service': 'spotify', 'reason': 'y', 'priority': 'critical'},
+        {'type': 'run_cleaners', 'service': 'linktree', 'reason': 'x', 'priority': 'medium'},
+    ]
+    results = monitor._execute_auto_remediation(actions)
+    assert calls == [('refresh', 'spotify'), ('clean', 'linktree')]
+    assert len(results) == 3
+    assert results[0]['action']['reason'] == 'y'
+    assert not results[1]['executed'] and 'Skipped' in results[1]['message']
+
+
+def test_run_cleaners_runs_scripts_as_subprocesses(tmp_path):
+    mod, monitor = get_monitor(tmp_path)
+    cleaners = tmp_path / 'src' / 'demo' / 'cleaners'
+    cleaners.mkdir(parents=True)
+    marker = tmp_path / 'ran.txt'
+    (cleaners / 'demo_landing2raw.py').write_text(
+        'import os\n'
+        'def main():\n'
+        f'    open({str(marker)!r}, "a").write(os.getcwd())\n'
+        'if __name__ == "__main__":\n'
+        '    main()\n'
+    )
+    (cleaners / 'demo_raw2staging.py').write_text('raise SystemExit(3)\n')
+    assert monitor._run_cleaners('demo') is False
+    assert marker.read_text() == str(tmp_path)
+
+
+def test_check_cookie_health_wildcard_accounts(tmp_path):
+    mod, monitor = get_monitor(tmp_path)
+    cookie_dir = tmp_path / 'src' / 'tiktok' / 'cookies'
+    cookie_dir.mkdir(parents=True)
+    (cookie_dir / 'tiktok_cookies_pig1987.json').write_text('[]')
+    (cookie_dir / 'notes.txt').write_text('')
+    health = monitor.check_cookie_health('tiktok')
+    assert health['status'] == 'multiple'
+    assert [c['account'] for c in health['cookies']] == ['pig1987']
+    assert health['cookies'][0]['status'] == 'valid'
+
+
+def test_check_zone_freshness_scans_subdirectories(tmp_path):
+    mod, monitor = get_monitor(tmp_path)
+    streams = tmp_path / 'raw' / 'toolost' / 'streams'
+    streams.mkdir(parents=True)
+    old = tmp_path / 'raw' / 'toolost' / 'old.json'
+    old.write_text('{}')
+    os.utime(old, (0, 0))
+    (streams / 'new.json').write_text('{}')
+    (streams / 'page.html').write_text('')
+    freshness = monitor.check_zone_freshness('toolost')
+    assert freshness['raw']['latest_file'] == 'new.json'
+    assert freshness['raw']['days_old'] == 0
+    assert freshness['landing']['exists'] is False
+
+
+def test_check_zone_freshness_reports_newest_file(tmp_path):
+    import time
+    mod, monitor = get_monitor(tmp_path)
+    raw = tmp_path / 'raw' / 'linktree'
+    raw.mkdir(parents=True)
+    now = time.time()
+    for name, age in (('a.json', 3600), ('b.json', 60), ('.hidden.json', 600)):
+        (raw / name).write_text('{}')
+        os.utime(raw / name, (now - age, now - age))
+    assert monitor.check_zone_freshness('linktree')['raw']['latest_file'] == 'b.json'
+    os.utime(raw / '.hidden.json', (now, now))    # dot-files count, as Path.glob did
+    assert monitor.check_zone_freshness('linktree')['raw']['latest_file'] == '.hidden.json'
+
+
+def test_print_report_writes_once_and_saves(tmp_path, capsys):
+    mod, monitor = get_monitor(tmp_path)
+    monitor.print_report(monitor.generate_report())
+    out = capsys.readouterr().out
+    assert 'BEDROT DATA PIPELINE HEALTH REPORT' in out
+    assert out.index('Reports saved:') < out.index('Summary:')
+    assert (tmp_path / 'pipeline_health_report.json').exists()
+    assert (tmp_path / 'pipeline_health_report.html').exists()
+
+
+def test_generate_html_report(tmp_path):
+    import json
+    mod, monitor = get_monitor(tmp_path)
+    out = tmp_path / 'report.html'
+    # A report read back from JSON has no precomputed action buckets
+    report = json.loads(mod.dump_report_json(monitor.generate_report()))
+    monitor._generate_html_report(report, out)
+    html = out.read_text(encoding='utf-8')
+    assert 'body { font-family' in html
+    assert 'SPOTIFY' in html
+    assert html.rstrip().endswith('</html>')
+
+
+def test_write_report_json_stdlib_fallback(tmp_path, monkeypatch):
+    import io
+    import json
+    mod, monitor = get_monitor(tmp_path)
+    report = monitor.generate_report()
+    monkeypatch.setattr(mod, 'orjson', None)
+    buf = io.BytesIO()
+    mod.write_report_json(report, buf)
+    assert json.loads(buf.getvalue()) == {k: v for k, v in report.items() if not k.startswith('_')}
+
+
+def test_save_reports_skips_html_when_disabled(tmp_path):
+    import io
+    mod, monitor = get_monitor(tmp_path, enable_html=False)
+    out = io.StringIO()
+    monitor._save_reports(monitor.generate_report(), out=out)
+    assert (tmp_path / 'pipeline_health_report.json').exists()
+    assert not (tmp_path / 'pipeline_health_report.html').exists()
+    assert 'HTML' not in out.getvalue()
+
+
+def test_generate_report_marks_hung_service_failed(tmp_path, monkeypatch):
+    import threading
+    mod, monitor = get_monitor(tmp_path)
+    release = threading.Event()
+    check = monitor._check_service
+    tiktok_calls = []
+
+    def slow_check(service):
+        if service == 'tiktok':
+            tiktok_calls.append(threading.current_thread())
+            release.wait(5)
+        return check(service)
+
+    monkeypatch.setattr(mod, 'SERVICE_CHECK_TIMEOUT_S', 0.5)
+    monitor._check_service = slow_check
+    try:
+        report = monitor.generate_report()
+        # Still hung: not started a second time, and never blocks exit
+        again = monitor.generate_report(force=True)
+        assert len(tiktok_calls) == 1 and tiktok_calls[0].daemon
+        assert again['services']['tiktok']['status'] == 'FAILED'
+    finally:
+        release.set()
+    assert list(report['services']) == monitor.services
+    assert report['services']['tiktok']['status'] == 'FAILED'
+    assert 'timed out' in report['services']['tiktok']['bottlenecks'][0]
+    assert not any('timed out' in b for b in report['services']['spotify']['bottlenecks'])
@@ -0,0 +1,68 @@
+import os
+import sys
+
+
+def get_module(tmp_path, monkeypatch):
+    monkeypatch.setenv('PROJECT_ROOT', str(tmp_path))
+    from src.common import run_with_auth_check as mod
+    return mod
+
+
+def test_main_runs_ready_services_and_reports_failures(tmp_path, monkeypatch, capsys):
+    mod = get_module(tmp_path, monkeypatch)
+    monkeypatch.setattr(mod, 'ensure_service_auth', lambda s, force_manual=False: s != 'toolost')
+    monkeypatch.setattr(mod, 'run_automated_extractors', lambda s: s != 'linktree')
+    monkeypatch.setattr(sys, 'argv', ['run_with_auth_check.py', 'spotify', 'toolost', 'linktree'])
+    assert mod.main() == 1
+    out = capsys.readouterr().out
+    assert 'Successful: spotify' in out
+    assert 'Failed: toolost, linktree' in out
+
+
+def test_check_cookie_freshness_detects_expired_cookie(tmp_path, monkeypatch):
+    import json
+    mod = get_module(tmp_path, monkeypatch)
+    cookie_dir = tmp_path / 'cookies'
+    cookie_dir.mkdir()
+    monkeypatch.setitem(mod._COOKIE_DIRS, 'spotify', cookie_dir)
+    cookie_file = cookie_dir / 'spotify_cookies.json'
+    cookie_file.write_text(json.dumps([{'name': 'a', 'expires': 1}, {'name': 'b', 'expires': -1}]))
+    assert mod.check_cookie_freshness('spotify') == (False, '1 cookies have expired', 0)
+    cookie_file.write_text(json.dumps([{'name': 'b', 'expires': -1}]))
+    is_fresh, reason, days_old = mod.check_cookie_freshness('spotify')
+    assert is_fresh and days_old == 0
+
+
+def test_check_cookie_freshness_uses_newest_tiktok_account(tmp_path, monkeypatch):
+    mod = get_module(tmp_path, monkeypatch)
+    cookie_dir = tmp_path / 'tiktok_cookies'
+    cookie_dir.mkdir()
+    monkeypatch.setitem(mod._COOKIE_DIRS, 'tiktok', cookie_dir)
+    old = cookie_dir / 'tiktok_cookies_old.json'
+    old.write_text('[]')
+    os.utime(old, (0, 0))
+    (cookie_dir / 'tiktok_cookies_new.json').write_text('[{"name": "a"}]')
+    assert mod.check_cookie_freshness('tiktok')[0] is True
+
+
+def test_check_cookie_freshness_stale_and_empty_files(tmp_path, monkeypatch):
+    mod = get_module(tmp_path, monkeypatch)
+    cookie_dir = tmp_path / 'linktree_cookies'
+    cookie_dir.mkdir()
+    monkeypatch.setitem(mod._COOKIE_DIRS, 'linktree', cookie_dir)
+    assert mod.check_cookie_freshness('linktree') == (False, 'Cookie file does not exist', -1)
+    cookie_file = cookie_dir / 'linktree_cookies.json'
+    cookie_file.write_text('[]')
+    assert mod.check_cookie_freshness('linktree') == (False, 'Cookie file is empty', 0)
+    cookie_file.write_text('not json')
+    os.utime(cookie_file, (0, 0))
+    is_fresh, reason, days_old = mod.check_cookie_freshness('linktree')
+    assert not is_fresh and 'max: 30' in reason
+
+
+def test_run_automated_extractors_fails_fast_on_missing_script(tmp_path, monkeypatch):
+    mod = get_module(tmp_path, monkeypatch)
+    config = dict(mod.AUTH_SERVICES['linktree'])
+    config['automated_scripts_abs'] = [str(tmp_path / 'missing.py')]
+    monkeypatch.setitem(mod.AUTH_SERVICES, 'linktree', config)
+    assert mod.run_automated_extractors('linktree') is False